@@ -12,6 +12,7 @@ from features.llm.services import LLMService
 from core.config.llm_config import LLMConfigManager
 from utils.logging_utils import get_logger
 from utils.error_utils import ErrorResponse
+from utils.json_provider import OrjsonProvider
 from utils.token_utils import TokenHandler
 from features.authentication.repositories import AuthRepository
 from features.authentication.services import AuthService
@@ -54,6 +55,8 @@ logger = get_logger(__name__)
 
 # Initialize Flask web application
 app = Flask(__name__)
+# 모든 JSON 응답을 orjson으로 직렬화
+app.json = OrjsonProvider(app)
 
 # --- CORS Configuration ---
 # Allow requests from the Next.js development server and production domains
@@ -131,7 +134,11 @@ def initialize_services():
             
             # 서비스 초기화 (단순화된 의존성)
             if hasattr(app, 'llm_service') and hasattr(app, 'chat_repository'):
-                app.input_classification_service = InputClassificationService(app.llm_service)
+                app.input_classification_service = InputClassificationService(
+                    app.llm_service,
+                    # 유사 입력 캐시는 의도가 다른 입력을 같은 분류로 재사용할 위험이 있어 기본 비활성화
+                    similarity_cache=os.getenv('CLASSIFY_SIMILARITY_CACHE', 'false').lower() == 'true'
+                )
                 app.query_processing_service = QueryProcessingService(app.llm_service, app.chat_repository)
                 app.data_analysis_service = AnalysisService(app.llm_service, app.chat_repository)
                 
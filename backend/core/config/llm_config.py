@@ -4,6 +4,7 @@ LLM 서비스 설정을 중앙에서 관리하는 매니저입니다.
 설정 파일 로드, 캐싱, 런타임 리로드를 지원합니다.
 """
 
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from core.config.models import LLMConfig, LLMTaskConfig, LLMModelConfig
 from core.config.config_loader import ConfigLoader
@@ -12,6 +13,11 @@ from utils.logging_utils import get_logger
 logger = get_logger(__name__)
 
 
+# 설정 관리 대상 태스크 유형
+_TASK_TYPES = ("classification", "sql_generation", "data_analysis",
+               "guide_generation", "out_of_scope")
+
+
 class LLMConfigManager:
     """LLM 설정 관리자
     
@@ -32,6 +38,8 @@ class LLMConfigManager:
         self.environment = environment
         self._config: Optional[LLMConfig] = None
         self._raw_config: Optional[Dict[str, Any]] = None
+        # 태스크명 -> 설정 조회 테이블 (설정 로드 시마다 재구성)
+        self._task_configs: Dict[str, LLMModelConfig] = {}
         
         # 초기 설정 로드
         self.reload_config()
@@ -60,7 +68,8 @@ class LLMConfigManager:
                     model_id=task_data.get("model", llm_section.get("default_model")),
                     max_tokens=task_data.get("max_tokens", 500),
                     temperature=task_data.get("temperature", 0.5),
-                    confidence=task_data.get("confidence")
+                    confidence=task_data.get("confidence"),
+                    max_input_tokens=task_data.get("max_input_tokens")
                 )
         
         # 누락된 태스크는 기본값으로 생성
@@ -110,13 +119,12 @@ class LLMConfigManager:
             
             # LLMConfig 객체로 파싱
             self._config = self._parse_config(self._raw_config)
+            self._index_task_configs()
             
             logger.info(f"LLM config reloaded. Default model: {self._config.default_model}")
             
             # 로드된 설정 요약 로깅
-            for task_type in ["classification", "sql_generation", "data_analysis", 
-                            "guide_generation", "out_of_scope"]:
-                config = self._config.tasks.get_config(task_type)
+            for task_type, config in self._task_configs.items():
                 logger.debug(f"Task '{task_type}': model={config.model_id}, "
                            f"max_tokens={config.max_tokens}, temperature={config.temperature}")
                 
@@ -150,6 +158,14 @@ class LLMConfigManager:
             available_models=[default_model],
             tasks=tasks
         )
+        self._index_task_configs()
+    
+    def _index_task_configs(self) -> None:
+        """태스크별 설정을 조회 테이블로 구성 (get_config 핫패스용)"""
+        self._task_configs = {
+            task_type: self._config.tasks.get_config(task_type)
+            for task_type in _TASK_TYPES
+        }
     
     def get_config(self, task_type: str) -> LLMModelConfig:
         """태스크별 설정 조회
@@ -163,6 +179,10 @@ class LLMConfigManager:
         Raises:
             ValueError: 알 수 없는 태스크 유형
         """
+        config = self._task_configs.get(task_type)
+        if config is not None:
+            return config
+        
         if self._config is None:
             self.reload_config()
         
@@ -212,4 +232,10 @@ class LLMConfigManager:
         if self._raw_config is None:
             self.reload_config()
         
-        return self._raw_config or {}
\ No newline at end of file
+        return self._raw_config or {}
+
+
+@lru_cache(maxsize=1)
+def get_llm_config_manager() -> LLMConfigManager:
+    """기본 LLMConfigManager 싱글톤 반환 (설정 파일을 프로세스당 한 번만 로드)"""
+    return LLMConfigManager()
@@ -17,11 +17,13 @@ class LLMModelConfig:
         max_tokens: 최대 생성 토큰 수
         temperature: 생성 다양성 (0.0-1.0)
         confidence: 응답 신뢰도 임계값 (0.0-1.0, 선택적)
+        max_input_tokens: 프롬프트에 넣는 컨텍스트의 추정 토큰 예산 (선택적, 없으면 제한 없음)
     """
     model_id: str
     max_tokens: int
     temperature: float
     confidence: Optional[float] = None
+    max_input_tokens: Optional[int] = None
     
     def __post_init__(self):
         """설정값 검증"""
@@ -31,6 +33,8 @@ class LLMModelConfig:
             raise ValueError(f"Max tokens must be positive, got {self.max_tokens}")
         if self.confidence is not None and not 0 <= self.confidence <= 1:
             raise ValueError(f"Confidence must be between 0 and 1, got {self.confidence}")
+        if self.max_input_tokens is not None and self.max_input_tokens <= 0:
+            raise ValueError(f"Max input tokens must be positive, got {self.max_input_tokens}")
     
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리로 변환"""
@@ -41,6 +45,8 @@ class LLMModelConfig:
         }
         if self.confidence is not None:
             result["confidence"] = self.confidence
+        if self.max_input_tokens is not None:
+            result["max_input_tokens"] = self.max_input_tokens
         return result
 
 
@@ -4,11 +4,11 @@ LLM 프로바이더가 구현해야 하는 인터페이스 정의
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterator
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMRequest:
     """LLM 요청 데이터 모델"""
     model: str
@@ -16,9 +16,11 @@ class LLMRequest:
     max_tokens: int = 4000
     temperature: float = 0.7
     system: Optional[str] = None
+    # 프롬프트 캐싱용 system 콘텐츠 블록 (설정 시 system 문자열 대신 사용)
+    system_blocks: Optional[List[Dict[str, Any]]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponse:
     """LLM 응답 데이터 모델"""
     content: str
@@ -60,16 +62,42 @@ class BaseLLMRepository(ABC):
         """
         pass
     
+    def stream_prompt(self, request: LLMRequest) -> Iterator[str]:
+        """
+        프롬프트 스트리밍 실행
+        
+        스트리밍을 지원하지 않는 프로바이더는 전체 응답을 한 번에 반환
+        
+        Args:
+            request: LLM 요청 객체
+            
+        Yields:
+            str: 응답 텍스트 조각
+        """
+        yield self.execute_prompt(request).content
+    
     @abstractmethod
-    def is_available(self) -> bool:
+    def is_available(self, force: bool = False) -> bool:
         """
         서비스 가용성 확인
         
+        Args:
+            force: 캐시된 확인 결과를 무시하고 다시 확인할지 여부
+        
         Returns:
             bool: 서비스 사용 가능 여부
         """
         pass
     
+    def is_degraded(self) -> bool:
+        """
+        장애 차단 상태 확인 (서킷 브레이커가 열려 호출을 즉시 거부하는 중인지)
+        
+        Returns:
+            bool: 차단 중이면 True
+        """
+        return False
+    
     @abstractmethod
     def get_model_info(self) -> Dict[str, Any]:
         """
@@ -7,7 +7,8 @@ from .context import (
     BlockType, 
     context_blocks_to_llm_format,
     context_blocks_to_complete_format,
-    create_analysis_context
+    create_analysis_context,
+    trim_context_blocks
 )
 
 __all__ = [
@@ -15,5 +16,6 @@ __all__ = [
     'BlockType', 
     'context_blocks_to_llm_format',
     'context_blocks_to_complete_format', 
-    'create_analysis_context'
+    'create_analysis_context',
+    'trim_context_blocks'
 ]
\ No newline at end of file
@@ -6,11 +6,13 @@ ContextBlock: 완전한 대화 컨텍스트 단위
 - 용도별 유틸리티 함수 제공 (토큰 절약용 vs 맥락 보존용)
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 from enum import Enum
 
+import orjson
+
 
 class BlockType(Enum):
     """컨텍스트 블록 타입"""
@@ -19,9 +21,9 @@ class BlockType(Enum):
     METADATA = "METADATA"         # 스키마 정보 조회
 
 
-@dataclass
+@dataclass(slots=True)
 class ContextBlock:
-    """컨텍스트 블록: 하나의 완전한 대화 컨텍스트 단위"""
+    """컨텍스트 블록: 하나의 완전한 대화 컨텍스트 단위 (slots 사용으로 인스턴스당 메모리 절감)"""
     # 기본 식별자
     block_id: str
     user_id: str
@@ -118,3 +120,29 @@ def create_analysis_context(blocks: List[ContextBlock]) -> Dict[str, Any]:
         },
         "limits": {"max_rows": 100}
     }
+
+
+def trim_context_blocks(
+    blocks: List[ContextBlock],
+    max_blocks: int = 8,
+    max_result_bytes: int = 2048
+) -> List[ContextBlock]:
+    """
+    LLM 프롬프트용 컨텍스트 축소 (토큰 절약용)
+    
+    최근 max_blocks개만 남기고, 직렬화 크기가 max_result_bytes를 넘는 execution_result는
+    행 수/컬럼 요약으로 대체한 얕은 복사본을 반환 (원본 블록은 저장/UI용으로 유지)
+    """
+    trimmed = []
+    for block in blocks[-max_blocks:]:
+        result = block.execution_result
+        if result and len(orjson.dumps(result, default=str)) > max_result_bytes:
+            rows = result.get("data") or []
+            columns = list(rows[0].keys()) if rows and isinstance(rows[0], dict) else []
+            row_count = result.get("row_count", len(rows))
+            block = replace(block, execution_result={
+                "row_count": row_count,
+                "summary": f"{row_count} rows, columns={columns}"
+            })
+        trimmed.append(block)
+    return trimmed
@@ -6,12 +6,16 @@ JSON 파일에서 프롬프트를 로드하고 템플릿 변수를 치환하여
 import json
 import os
 import logging
+import time
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple, FrozenSet, Union, Callable
 from string import Template
 
 logger = logging.getLogger(__name__)
 
+# 프롬프트 파일 변경 여부(mtime) 재확인 간격 (초) - 핫패스의 파일 stat 호출 억제
+_RELOAD_CHECK_INTERVAL = 2.0
+
 
 class PromptManager:
     """프롬프트 중앙 관리 클래스"""
@@ -33,6 +37,10 @@ class PromptManager:
         # 프롬프트 캐시
         self._cache: Dict[str, Dict[str, Any]] = {}
         self._file_timestamps: Dict[str, float] = {}
+        # 카테고리별 마지막 mtime 확인 시각 (monotonic)
+        self._checked_at: Dict[str, float] = {}
+        # 컴파일된 템플릿 캐시: (카테고리, 템플릿명) -> (Template, 변수 식별자 집합)
+        self._compiled: Dict[Tuple[str, str], Tuple[Template, FrozenSet[str]]] = {}
         
         # 캐싱 활성화 여부
         self.enable_cache = True
@@ -46,7 +54,7 @@ class PromptManager:
         self, 
         category: str, 
         template_name: str, 
-        fallback_prompt: str = None,
+        fallback_prompt: Union[str, Callable[[], str], None] = None,
         **variables
     ) -> str:
         """
@@ -55,7 +63,7 @@ class PromptManager:
         Args:
             category: 프롬프트 카테고리 (파일명과 동일)
             template_name: 템플릿 이름
-            fallback_prompt: 로드 실패 시 사용할 기본 프롬프트
+            fallback_prompt: 로드 실패 시 사용할 기본 프롬프트 (호출 가능 객체면 실패 시에만 생성)
             **variables: 템플릿에 치환할 변수들
             
         Returns:
@@ -65,29 +73,21 @@ class PromptManager:
             PromptLoadError: 프롬프트 로드 실패 시
         """
         try:
-            # 프롬프트 데이터 로드
-            prompt_data = self._load_prompt_category(category)
-            
-            if template_name not in prompt_data.get('templates', {}):
-                raise KeyError(f"템플릿 '{template_name}'을 찾을 수 없습니다")
-            
-            template_info = prompt_data['templates'][template_name]
-            template_content = template_info['content']
+            # 컴파일된 템플릿 로드 (파일 변경 시에만 재컴파일)
+            template, identifiers = self.compile(category, template_name)
+            template_content = template.template
             
             # 변수 치환
             if variables:
                 try:
                     # Python string.Template 사용 (안전한 치환)
-                    template = Template(template_content)
                     final_prompt = template.safe_substitute(**variables)
                     
                     # 치환되지 않은 변수가 있는지 확인 (개발 시 디버깅용)
-                    remaining_vars = set(template.get_identifiers())
-                    provided_vars = set(variables.keys())
-                    missing_vars = remaining_vars - provided_vars
+                    missing_vars = identifiers.difference(variables)
                     
                     if missing_vars:
-                        logger.warning(f"⚠️ 치환되지 않은 변수들: {missing_vars}")
+                        logger.warning(f"⚠️ 치환되지 않은 변수들: {set(missing_vars)}")
                     
                 except (KeyError, ValueError) as e:
                     logger.error(f"❌ 변수 치환 실패: {str(e)}")
@@ -103,6 +103,8 @@ class PromptManager:
             logger.error(f"❌ 프롬프트 로드 실패: {category}.{template_name} - {str(e)}")
             
             # Fallback 프롬프트 사용
+            if callable(fallback_prompt):
+                fallback_prompt = fallback_prompt()
             if fallback_prompt:
                 logger.info(f"🔄 Fallback 프롬프트 사용: {category}.{template_name}")
                 return fallback_prompt
@@ -110,6 +112,33 @@ class PromptManager:
             # Fallback도 없으면 예외 발생
             raise PromptLoadError(f"프롬프트 로드 실패 및 Fallback 없음: {category}.{template_name}")
     
+    def compile(self, category: str, template_name: str) -> Tuple[Template, FrozenSet[str]]:
+        """
+        템플릿을 string.Template으로 컴파일하여 반환 (카테고리 파일이 다시 로드될 때까지 재사용)
+        
+        Args:
+            category: 프롬프트 카테고리
+            template_name: 템플릿 이름
+            
+        Returns:
+            (컴파일된 Template, 템플릿 변수 식별자 집합)
+        """
+        # 파일 변경 시 _load_prompt_category가 컴파일 캐시를 비움
+        prompt_data = self._load_prompt_category(category)
+        
+        key = (category, template_name)
+        compiled = self._compiled.get(key)
+        if compiled is not None:
+            return compiled
+        
+        if template_name not in prompt_data.get('templates', {}):
+            raise KeyError(f"템플릿 '{template_name}'을 찾을 수 없습니다")
+        
+        template = Template(prompt_data['templates'][template_name]['content'])
+        compiled = (template, frozenset(template.get_identifiers()))
+        self._compiled[key] = compiled
+        return compiled
+    
     def _load_prompt_category(self, category: str) -> Dict[str, Any]:
         """
         특정 카테고리의 프롬프트 파일 로드
@@ -120,6 +149,12 @@ class PromptManager:
         Returns:
             프롬프트 데이터 딕셔너리
         """
+        # 최근에 변경 여부를 확인했다면 파일 시스템 조회 없이 캐시 반환
+        now = time.monotonic()
+        if self.enable_cache and category in self._cache and \
+                now - self._checked_at.get(category, float('-inf')) < _RELOAD_CHECK_INTERVAL:
+            return self._cache[category]
+        
         file_path = self.prompts_dir / f"{category}.json"
         
         # 파일 존재 확인
@@ -128,6 +163,7 @@ class PromptManager:
         
         # 캐시 확인 (파일 수정 시간 기준)
         if self.enable_cache and self._is_cache_valid(category, file_path):
+            self._checked_at[category] = now
             return self._cache[category]
         
         # 파일 로드
@@ -138,10 +174,12 @@ class PromptManager:
             # 스키마 검증
             self._validate_prompt_schema(prompt_data, category)
             
-            # 캐시 업데이트
+            # 캐시 업데이트 (해당 카테고리의 컴파일된 템플릿 무효화)
+            self._invalidate_compiled(category)
             if self.enable_cache:
                 self._cache[category] = prompt_data
                 self._file_timestamps[category] = file_path.stat().st_mtime
+                self._checked_at[category] = now
             
             logger.debug(f"📂 프롬프트 파일 로드: {category}.json")
             return prompt_data
@@ -151,6 +189,11 @@ class PromptManager:
         except Exception as e:
             raise PromptLoadError(f"파일 읽기 오류: {file_path} - {str(e)}")
     
+    def _invalidate_compiled(self, category: str) -> None:
+        """특정 카테고리의 컴파일된 템플릿 캐시 제거"""
+        for key in [key for key in self._compiled if key[0] == category]:
+            self._compiled.pop(key, None)
+    
     def _is_cache_valid(self, category: str, file_path: Path) -> bool:
         """
         캐시가 유효한지 확인 (파일 수정 시간 기준)
@@ -248,6 +291,8 @@ class PromptManager:
         """
         self._cache.clear()
         self._file_timestamps.clear()
+        self._checked_at.clear()
+        self._compiled.clear()
         
         # 사용 가능한 프롬프트 파일들을 미리 로드
         json_files = list(self.prompts_dir.glob("*.json"))
@@ -279,6 +324,8 @@ class PromptManager:
                 del self._cache[category]
             if category in self._file_timestamps:
                 del self._file_timestamps[category]
+            self._checked_at.pop(category, None)
+            self._invalidate_compiled(category)
             
             # 다시 로드
             self._load_prompt_category(category)
@@ -3,29 +3,74 @@ GCS (Google Cloud Storage) Repository 기반 클래스
 MetaSync 및 기타 GCS 기반 기능을 위한 추상 클래스
 """
 
-import json
+import orjson
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 from datetime import datetime, timezone
+import google.auth
+from google.auth.transport.requests import AuthorizedSession
 from google.cloud import storage
 from google.cloud.exceptions import NotFound
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
+import threading
 from utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+# GCS 저장용 JSON 형식 (기존 indent=2, ensure_ascii=False 출력과 동일)
+_JSON_WRITE_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
+def dump_json_bytes(data: Any) -> bytes:
+    """GCS 저장용 JSON 바이트 직렬화 (datetime은 ISO 형식, 그 외 비표준 타입은 문자열)"""
+    return orjson.dumps(data, option=_JSON_WRITE_OPTIONS, default=str)
+
+
+# Google API 공용 HTTP 연결 풀 설정 (멱등 요청만 재시도)
+_HTTP_POOL_CONNECTIONS = 8
+_HTTP_POOL_MAXSIZE = 32
+_HTTP_RETRY = Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504])
+
 
 class GCSClient:
     """Google Cloud Storage 클라이언트 싱글톤"""
     
     _instance: Optional[storage.Client] = None
+    _http: Optional[AuthorizedSession] = None
+    _lock = threading.Lock()
+    
+    @classmethod
+    def get_http_session(cls) -> AuthorizedSession:
+        """
+        GCS/BigQuery 클라이언트가 공유하는 인증 HTTP 세션 반환
+        커넥션 풀로 요청마다 TCP/TLS 연결을 새로 맺지 않음
+        """
+        if cls._http is None:
+            with cls._lock:
+                if cls._http is None:
+                    credentials, _ = google.auth.default(
+                        scopes=['https://www.googleapis.com/auth/cloud-platform']
+                    )
+                    session = AuthorizedSession(credentials)
+                    session.mount('https://', HTTPAdapter(
+                        pool_connections=_HTTP_POOL_CONNECTIONS,
+                        pool_maxsize=_HTTP_POOL_MAXSIZE,
+                        max_retries=_HTTP_RETRY
+                    ))
+                    cls._http = session
+        return cls._http
     
     @classmethod
     def get_client(cls, project_id: Optional[str] = None) -> storage.Client:
         """GCS 클라이언트 인스턴스 반환"""
         if cls._instance is None:
-            project = project_id or os.environ.get('GOOGLE_CLOUD_PROJECT', 'nlq-ex')
-            cls._instance = storage.Client(project=project)
+            http = cls.get_http_session()
+            with cls._lock:
+                if cls._instance is None:
+                    project = project_id or os.environ.get('GOOGLE_CLOUD_PROJECT', 'nlq-ex')
+                    cls._instance = storage.Client(project=project, _http=http)
         return cls._instance
 
 
@@ -74,18 +119,39 @@ class GCSRepository(ABC):
                 logger.warning(f"Blob {blob_path} not found in bucket {self.bucket_name}")
                 return {}
             
-            content = blob.download_as_text()
-            return json.loads(content)
+            # 바이트 그대로 파싱 (텍스트 디코딩 단계 생략)
+            return orjson.loads(blob.download_as_bytes())
         except NotFound:
             logger.warning(f"File {blob_path} not found in GCS")
             return {}
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to decode JSON from {blob_path}: {str(e)}")
             return {}
         except Exception as e:
             logger.error(f"Failed to read {blob_path} from GCS: {str(e)}")
             raise
 
+    def read_bytes(self, blob_path: str,
+                   if_generation_not_match: Optional[int] = None) -> Tuple[Optional[bytes], Optional[int]]:
+        """
+        GCS에서 파일을 원본 바이트 그대로 읽기
+        
+        Args:
+            blob_path: 파일 경로 (예: "metadata_cache.json")
+            if_generation_not_match: 지정 시 객체 generation이 이 값과 다를 때만 내려받음
+                (같으면 google.api_core.exceptions.NotModified 발생)
+            
+        Returns:
+            (파일 내용 바이트, 객체 generation) - 파일이 없으면 (None, None)
+        """
+        blob = self.bucket.blob(blob_path)
+        try:
+            content = blob.download_as_bytes(if_generation_not_match=if_generation_not_match)
+        except NotFound:
+            logger.warning(f"File {blob_path} not found in GCS")
+            return None, None
+        return content, blob.generation
+    
     def read_text(self, blob_path: str) -> str:
         """
         GCS에서 텍스트 파일 읽기 (원본 문자열 그대로)
@@ -125,14 +191,29 @@ class GCSRepository(ABC):
         Returns:
             성공 여부
         """
+        # 한 번만 직렬화하여 스냅샷과 메인 파일에 공용
+        return self.write_json_bytes(blob_path, dump_json_bytes(data), create_snapshot) is not None
+    
+    def write_json_bytes(self, blob_path: str, json_content: bytes,
+                         create_snapshot: bool = False) -> Optional[int]:
+        """
+        이미 직렬화된 JSON 바이트를 GCS에 쓰기
+        
+        Args:
+            blob_path: 파일 경로 (예: "metadata_cache.json")
+            json_content: 저장할 JSON 바이트
+            create_snapshot: 스냅샷 생성 여부
+            
+        Returns:
+            저장된 객체의 generation (실패 시 None)
+        """
         try:
             # 스냅샷 생성 (선택적)
             if create_snapshot:
-                self._create_snapshot(blob_path, data)
+                self._create_snapshot(blob_path, json_content)
             
             # 메인 파일 저장
             blob = self.bucket.blob(blob_path)
-            json_content = json.dumps(data, ensure_ascii=False, indent=2)
             
             blob.upload_from_string(
                 json_content,
@@ -140,18 +221,18 @@ class GCSRepository(ABC):
             )
             
             logger.info(f"Successfully wrote {blob_path} to GCS")
-            return True
+            return blob.generation
         except Exception as e:
             logger.error(f"Failed to write {blob_path} to GCS: {str(e)}")
-            return False
+            return None
     
-    def _create_snapshot(self, blob_path: str, data: Dict[str, Any]) -> Optional[str]:
+    def _create_snapshot(self, blob_path: str, json_content: bytes) -> Optional[str]:
         """
         스냅샷 생성 (백업용)
         
         Args:
             blob_path: 원본 파일 경로
-            data: 저장할 데이터
+            json_content: 저장할 JSON 바이트
             
         Returns:
             스냅샷 경로 또는 None
@@ -164,7 +245,6 @@ class GCSRepository(ABC):
             
             # 스냅샷 저장
             snapshot_blob = self.bucket.blob(snapshot_path)
-            json_content = json.dumps(data, ensure_ascii=False, indent=2)
             
             snapshot_blob.upload_from_string(
                 json_content,
@@ -177,18 +257,25 @@ class GCSRepository(ABC):
             logger.error(f"Failed to create snapshot: {str(e)}")
             return None
     
-    def list_blobs(self, prefix: Optional[str] = None) -> List[str]:
+    def list_blobs(self, prefix: Optional[str] = None, max_results: Optional[int] = None) -> List[str]:
         """
         버킷 내 파일 목록 조회
         
         Args:
             prefix: 경로 접두어 (예: "snapshots/")
+            max_results: 최대 조회 개수 (GCS는 이름 오름차순으로 반환, None이면 전체)
             
         Returns:
             파일 경로 목록
         """
         try:
-            blobs = self.bucket.list_blobs(prefix=prefix)
+            # 이름만 필요하므로 응답 필드를 제한하고 페이지를 크게 잡아 왕복 횟수 감소
+            blobs = self.bucket.list_blobs(
+                prefix=prefix,
+                max_results=max_results,
+                page_size=min(1000, max_results) if max_results else 1000,
+                fields='items(name),nextPageToken'
+            )
             return [blob.name for blob in blobs]
         except Exception as e:
             logger.error(f"Failed to list blobs: {str(e)}")
@@ -228,13 +315,12 @@ class GCSRepository(ABC):
             메타데이터 딕셔너리
         """
         try:
-            blob = self.bucket.blob(blob_path)
+            # 존재 확인과 메타데이터 조회를 한 번의 요청으로 처리
+            blob = self.bucket.get_blob(blob_path)
             
-            if not blob.exists():
+            if blob is None:
                 return {}
             
-            blob.reload()
-            
             return {
                 "size": blob.size,
                 "content_type": blob.content_type,
@@ -3,8 +3,11 @@ Authentication Service
 인증 관련 비즈니스 로직 계층
 """
 
-import hashlib
-from typing import Dict, Any
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional
+import jwt
+import xxhash
 from utils.token_utils import TokenHandler
 from utils.time_utils import TimeManager
 from utils.logging_utils import get_logger
@@ -12,6 +15,9 @@ from .repositories import AuthRepository
 
 logger = get_logger(__name__)
 
+# Google 토큰 검증과 화이트리스트 조회를 병렬 실행하기 위한 공유 풀
+_auth_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="auth")
+
 
 class AuthService:
     """인증 비즈니스 로직 계층"""
@@ -20,20 +26,33 @@ class AuthService:
         self.token_handler = token_handler
         self.auth_repository = auth_repository
         self.active_sessions = {}
+        # 이메일 → 세션 ID 역인덱스 (로그아웃 시 전체 세션 순회 방지)
+        self._sessions_by_user = defaultdict(set)
     
     def authenticate_google_user(self, id_token: str) -> Dict[str, Any]:
         """Google ID 토큰 검증 및 사용자 인증"""
         try:
-            # Google 토큰 검증
+            # 서명 검증 전 클레임에서 이메일을 읽어 화이트리스트 조회를 먼저 시작
+            unverified_email = self._peek_token_email(id_token)
+            whitelist_future = None
+            if unverified_email:
+                whitelist_future = _auth_executor.submit(
+                    self.auth_repository.check_user_whitelist, unverified_email
+                )
+            
+            # Google 토큰 검증 (화이트리스트 조회와 동시 진행)
             token_result = self.token_handler.verify_google_token(id_token)
             if not token_result['success']:
                 return token_result
             
-            # 화이트리스트 검증 (이메일 기반)
+            # 화이트리스트 검증 (이메일 기반) - 검증된 이메일과 일치할 때만 선조회 결과 사용
             user_info = token_result['user_info']
-            whitelist_result = self.auth_repository.check_user_whitelist(
-                user_info['email']  # 이메일만 사용
-            )
+            if whitelist_future is not None and unverified_email == user_info['email']:
+                whitelist_result = whitelist_future.result()
+            else:
+                whitelist_result = self.auth_repository.check_user_whitelist(
+                    user_info['email']  # 이메일만 사용
+                )
             
             if not whitelist_result['success']:
                 return {
@@ -70,15 +89,18 @@ class AuthService:
             if not token_result['success']:
                 return token_result
             
-            # 세션 저장 (이메일 기반)
-            session_id = self._generate_session_id(user_info['email'])  # 이메일 사용
+            # 세션 저장 (이메일 기반) - 현재 시각은 한 번만 조회하여 재사용
+            now = TimeManager.utc_now()
+            now_str = now.isoformat()
+            session_id = self._generate_session_id(user_info['email'], int(now.timestamp()))  # 이메일 사용
             session_data = {
                 'user_info': user_info,
-                'created_at': TimeManager.utc_datetime_string(),
-                'last_activity': TimeManager.utc_datetime_string()
+                'created_at': now_str,
+                'last_activity': now_str
             }
             
             self.active_sessions[session_id] = session_data
+            self._sessions_by_user[user_info['email']].add(session_id)
             return token_result
             
         except Exception as e:
@@ -96,13 +118,10 @@ class AuthService:
     def logout_user(self, user_email: str) -> Dict[str, Any]:
         """사용자 로그아웃 (이메일 기반)"""
         try:
-            sessions_to_remove = [
-                session_id for session_id, session_data in self.active_sessions.items()
-                if session_data['user_info']['email'] == user_email
-            ]
+            sessions_to_remove = self._sessions_by_user.pop(user_email, ())
             
             for session_id in sessions_to_remove:
-                del self.active_sessions[session_id]
+                self.active_sessions.pop(session_id, None)
             
             return {
                 'success': True,
@@ -118,8 +137,19 @@ class AuthService:
         """세션을 사용자에게 연결 (이메일 기반)"""
         return self.auth_repository.link_session_to_user(session_id, user_email)
     
-    def _generate_session_id(self, user_email: str) -> str:
+    @staticmethod
+    def _peek_token_email(id_token: str) -> str:
+        """서명 검증 없이 ID 토큰의 이메일 클레임 추출 (선조회 용도, 실패 시 빈 문자열)"""
+        try:
+            claims = jwt.decode(id_token, options={"verify_signature": False})
+            return claims.get('email', '')
+        except Exception:
+            return ''
+    
+    def _generate_session_id(self, user_email: str, current_timestamp: Optional[int] = None) -> str:
         """세션 ID 생성 (이메일 기반)"""
-        current_timestamp = int(TimeManager.utc_now().timestamp())
+        if current_timestamp is None:
+            current_timestamp = int(TimeManager.utc_now().timestamp())
         session_data = f"{user_email}:{current_timestamp}"
-        return hashlib.md5(session_data.encode()).hexdigest()
\ No newline at end of file
+        # 보안 요구사항이 없는 식별자이므로 비암호화 해시 사용
+        return xxhash.xxh128_hexdigest(session_data)
\ No newline at end of file
@@ -5,6 +5,7 @@ Chat 모델 정의
 
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+import orjson
 from pydantic import BaseModel, Field
 from core.models import ContextBlock
 
@@ -73,7 +74,11 @@ class StreamEvent(BaseModel):
     event: str = Field(..., description="이벤트 타입")
     data: Dict[str, Any] = Field(..., description="이벤트 데이터")
     
-    def to_sse(self) -> str:
-        """SSE 형식으로 변환"""
-        import json
-        return f"event: {self.event}\ndata: {json.dumps(self.data, ensure_ascii=False)}\n\n"
\ No newline at end of file
+    def to_sse(self) -> bytes:
+        """SSE 형식으로 변환 (WSGI 계층에서 재인코딩이 없도록 UTF-8 바이트로 반환)"""
+        return encode_sse(self.event, self.data)
+
+
+def encode_sse(event: str, data: Dict[str, Any]) -> bytes:
+    """모델 생성/검증 없이 이벤트와 데이터를 SSE 바이트로 직렬화 (스트리밍 핫패스용)"""
+    return b"event: %s\ndata: %s\n\n" % (event.encode(), orjson.dumps(data))
\ No newline at end of file
@@ -3,6 +3,7 @@ Chat Repository
 대화 관련 데이터 접근 계층 - ContextBlock 중심 Firestore 구현
 """
 
+import sys
 import uuid
 from datetime import datetime, timezone
 from typing import Dict, Any, List, Optional
@@ -13,6 +14,14 @@ from utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+# 문서 → ContextBlock 변환 시 Enum 생성자 호출 대신 사용하는 조회 테이블
+_BLOCK_TYPES = {block_type.value: block_type for block_type in BlockType}
+
+
+def _intern(value: Any) -> Any:
+    """반복되는 문자열 필드만 intern (None/비문자열 값은 그대로 반환)"""
+    return sys.intern(value) if isinstance(value, str) else value
+
 
 class ChatRepository(FirestoreRepository):
     """
@@ -23,6 +32,8 @@ class ChatRepository(FirestoreRepository):
     def __init__(self, project_id: Optional[str] = None):
         # users 컬렉션을 기본으로 사용 (서브컬렉션으로 conversations 관리)
         super().__init__(collection_name="users", project_id=project_id)
+        # 호출마다 재생성하지 않도록 users 컬렉션 참조를 초기화 시 한 번만 구성
+        self._users_ref = self.client.collection(self.collection_name)
     
     def save_context_block(self, context_block: ContextBlock) -> Dict[str, Any]:
         """
@@ -34,7 +45,7 @@ class ChatRepository(FirestoreRepository):
             block_data = context_block.to_dict()
             
             # 사용자별 conversations 서브컬렉션에 저장 (이메일을 user_id로 사용)
-            user_ref = self.client.collection("users").document(context_block.user_id)
+            user_ref = self._users_ref.document(context_block.user_id)
             conversations_ref = user_ref.collection("conversations")
             
             # block_id를 문서 ID로 사용하여 저장
@@ -58,7 +69,7 @@ class ChatRepository(FirestoreRepository):
         """
         try:
             # 사용자별 conversations 서브컬렉션에서 조회 (user_id = 이메일)
-            user_ref = self.client.collection("users").document(user_id)
+            user_ref = self._users_ref.document(user_id)
             conversations_ref = user_ref.collection("conversations")
             
             # timestamp 기준 오름차순으로 정렬하여 오래된 대화부터 조회 (ContextBlock 시간순)
@@ -78,20 +89,19 @@ class ChatRepository(FirestoreRepository):
                     elif isinstance(timestamp, str):
                         timestamp = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
                     
-                    # BlockType enum 변환
-                    block_type_str = doc_data.get('block_type', 'QUERY')
-                    block_type = BlockType(block_type_str) if block_type_str else BlockType.QUERY
+                    # BlockType enum 변환 (알 수 없는 값은 QUERY로 처리)
+                    block_type = _BLOCK_TYPES.get(doc_data.get('block_type')) or BlockType.QUERY
                     
                     context_block = ContextBlock(
                         block_id=doc_data.get('block_id', ''),
-                        user_id=doc_data.get('user_id', user_id),  # user_id = 이메일
+                        user_id=_intern(doc_data.get('user_id') or user_id),  # user_id = 이메일
                         timestamp=timestamp or datetime.now(timezone.utc),
                         block_type=block_type,
                         user_request=doc_data.get('user_request', ''),
                         assistant_response=doc_data.get('assistant_response', ''),
                         generated_query=doc_data.get('generated_query'),
                         execution_result=doc_data.get('execution_result'),
-                        status=doc_data.get('status', 'completed')
+                        status=_intern(doc_data.get('status') or 'completed')
                     )
                     context_blocks.append(context_block)
                     
@@ -5,6 +5,8 @@
 
 import time
 import uuid
+from operator import attrgetter
+import orjson
 from flask import Blueprint, request, jsonify, g, Response, current_app
 from utils.decorators import require_auth
 from utils.error_utils import ErrorResponse, SuccessResponse
@@ -15,6 +17,16 @@ logger = get_logger(__name__)
 
 chat_bp = Blueprint('chat', __name__, url_prefix='/api')
 
+# SSE 에러 프레임 (바이트로 미리 구성)
+_SSE_ERROR_PREFIX = b"event: error\ndata: "
+_SSE_SUFFIX = b"\n\n"
+
+# ContextBlock → 메시지 변환에 필요한 필드를 한 번에 추출
+_get_message_fields = attrgetter(
+    'block_id', 'user_request', 'assistant_response',
+    'timestamp', 'generated_query', 'execution_result'
+)
+
 @chat_bp.route('/chat-stream', methods=['POST'])
 @require_auth
 def process_chat_stream():
@@ -40,9 +52,8 @@ def process_chat_stream():
         with app.app_context():
             try:
                 if not chat_service:
-                    import json
-                    error_data = json.dumps({'error': 'ChatService not initialized', 'error_type': 'service_error'})
-                    yield f"event: error\ndata: {error_data}\n\n"
+                    error_data = orjson.dumps({'error': 'ChatService not initialized', 'error_type': 'service_error'})
+                    yield _SSE_ERROR_PREFIX + error_data + _SSE_SUFFIX
                     return
                 
                 logger.info(f"🎯 [{request_id}] Processing streaming chat: {message[:50]}...")
@@ -63,9 +74,8 @@ def process_chat_stream():
 
             except Exception as e:
                 logger.error(f"❌ [{request_id}] Streaming error: {str(e)}")
-                import json
-                error_data = json.dumps({'error': f'Server error: {str(e)}', 'error_type': 'internal_error'})
-                yield f"event: error\ndata: {error_data}\n\n"
+                error_data = orjson.dumps({'error': f'Server error: {str(e)}', 'error_type': 'internal_error'})
+                yield _SSE_ERROR_PREFIX + error_data + _SSE_SUFFIX
 
     return Response(generate_stream(), mimetype='text/event-stream', headers={'Cache-Control': 'no-cache', 'Connection': 'keep-alive', 'X-Accel-Buffering': 'no'})
 
@@ -95,27 +105,30 @@ def get_latest_conversation():
         # ContextBlock을 프론트엔드 호환 형식으로 변환
         formatted_messages = []
         for context_block in context_result['context_blocks']:
+            block_id, user_request, assistant_response, timestamp, generated_query, execution_result = \
+                _get_message_fields(context_block)
+            timestamp_str = timestamp.isoformat() if timestamp else None
+            
             # 사용자 메시지
-            if context_block.user_request:
+            if user_request:
                 formatted_messages.append({
-                    "message_id": f"{context_block.block_id}_user",
-                    "message": context_block.user_request,
+                    "message_id": f"{block_id}_user",
+                    "message": user_request,
                     "message_type": "user",
-                    "timestamp": context_block.timestamp.isoformat() if context_block.timestamp else None
+                    "timestamp": timestamp_str
                 })
             
             # AI 응답 메시지
-            if context_block.assistant_response:
-                assistant_msg = {
-                    "message_id": f"{context_block.block_id}_assistant", 
-                    "message": context_block.assistant_response,
+            if assistant_response:
+                formatted_messages.append({
+                    "message_id": f"{block_id}_assistant", 
+                    "message": assistant_response,
                     "message_type": "assistant",
-                    "timestamp": context_block.timestamp.isoformat() if context_block.timestamp else None,
-                    "generated_sql": context_block.generated_query,
-                    "result_data": context_block.execution_result.get('data') if context_block.execution_result else None,
-                    "result_row_count": context_block.execution_result.get('row_count') if context_block.execution_result else None
-                }
-                formatted_messages.append(assistant_msg)
+                    "timestamp": timestamp_str,
+                    "generated_sql": generated_query,
+                    "result_data": execution_result.get('data') if execution_result else None,
+                    "result_row_count": execution_result.get('row_count') if execution_result else None
+                })
         
         return jsonify(SuccessResponse.success({
             "conversation": {
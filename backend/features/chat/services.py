@@ -3,21 +3,72 @@ Chat Service
 대화 워크플로우 오케스트레이션 - 도메인 서비스들을 조율하여 대화 처리
 """
 
-from typing import Dict, Any, List, Optional, Generator
+from typing import Dict, Any, List, Optional, Generator, Final, Mapping, Tuple
+from types import MappingProxyType
+import atexit
 import json
-from datetime import datetime
+import secrets
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 
 from features.chat.repositories import ChatRepository
-from features.chat.models import ChatRequest, ChatResponse, ChatContext, StreamEvent
+from features.chat.models import ChatRequest, ChatResponse, ChatContext, encode_sse as _emit
 from features.input_classification.services import InputClassificationService
 from features.query_processing.services import QueryProcessingService
 from features.data_analysis.services import AnalysisService
-from core.models import ContextBlock
+from features.query_processing.models import QueryRequest
+from features.data_analysis.models import AnalysisRequest
+from core.models import ContextBlock, BlockType, trim_context_blocks
 from utils.logging_utils import get_logger
 from utils.error_utils import ErrorResponse
 
 logger = get_logger(__name__)
 
+# 대화 저장 등 I/O 작업을 요청 흐름과 겹쳐 실행하기 위한 공유 풀
+_chat_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="chat")
+# 종료 시 대기 중인 백그라운드 저장이 끝날 때까지 기다림
+atexit.register(_chat_executor.shutdown, wait=True)
+
+# 카테고리에 따른 최종 결과 타입 매핑
+_RESULT_TYPE_MAPPING: Final[Mapping[str, str]] = MappingProxyType({
+    "query_request": "query_result",
+    "data_analysis": "analysis_result",
+    "metadata_request": "metadata_result",
+    "guide_request": "guide_result",
+    "out_of_scope": "out_of_scope_result"
+})
+
+# LLM 장애로 서킷 브레이커가 열렸을 때의 안내 메시지
+_DEGRADED_MESSAGE: Final[str] = "현재 AI 서비스 요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요."
+
+_GUIDE_MESSAGE: Final[str] = """
+Analytics Assistant AI 사용 가이드:
+
+**사용 가능한 기능:**
+1. **데이터 조회**: "지난달 매출은?", "어제 사용자 수 조회"
+2. **데이터 분석**: "매출 추이 분석", "사용자 행동 패턴 분석"
+3. **메타데이터 조회**: "테이블 구조 보여줘", "컬럼 정보 확인"
+
+**팁:**
+- 구체적인 기간과 지표를 명시하면 더 정확한 결과를 얻을 수 있습니다
+- 이전 대화 내용을 참조하여 연속적인 질문이 가능합니다
+- SQL을 직접 확인하고 수정을 요청할 수 있습니다
+"""
+
+
+def _log_save_failure(future) -> None:
+    """백그라운드 대화 저장 실패 로깅"""
+    try:
+        save_result = future.result()
+    except Exception as e:
+        logger.error(f"백그라운드 대화 저장 중 오류: {str(e)}")
+        return
+    if not save_result.get('success'):
+        logger.error(f"백그라운드 대화 저장 실패: {save_result.get('error')}")
+
 
 class ChatService:
     """대화 워크플로우 오케스트레이션 서비스"""
@@ -27,7 +78,8 @@ class ChatService:
         chat_repository: ChatRepository,
         classification_service: InputClassificationService,
         query_service: QueryProcessingService,
-        analysis_service: AnalysisService
+        analysis_service: AnalysisService,
+        context_ttl: float = 60.0
     ):
         """
         ChatService 초기화
@@ -37,16 +89,23 @@ class ChatService:
             classification_service: 입력 분류 서비스
             query_service: 쿼리 처리 서비스 
             analysis_service: 데이터 분석 서비스
+            context_ttl: 사용자별 컨텍스트 캐시 유지 시간 (초)
         """
         self.chat_repository = chat_repository
         self.classification_service = classification_service
         self.query_service = query_service
         self.analysis_service = analysis_service
+        
+        # 사용자별 컨텍스트 캐시: user_id -> (조회 시각, 블록 리스트, 조회 시 limit)
+        # 프로세스(워커)별 캐시이므로, 다른 워커가 저장한 블록은 최대 context_ttl초 늦게 반영됨
+        self._ctx_cache: Dict[str, Tuple[float, List[ContextBlock], int]] = {}
+        self._ctx_ttl = context_ttl
+        self._ctx_lock = threading.Lock()
     
     def process_conversation(
         self, 
         request: ChatRequest
-    ) -> Generator[str, None, None]:
+    ) -> Generator[bytes, None, None]:
         """
         대화 처리 워크플로우 오케스트레이션
         
@@ -54,43 +113,47 @@ class ChatService:
             request: 대화 요청
             
         Yields:
-            SSE 형식의 스트림 이벤트
+            SSE 형식의 스트림 이벤트 (UTF-8 바이트)
         """
         try:
             # 1. 컨텍스트 로드
             context = self.load_context(request.user_id, request.context_limit)
-            yield StreamEvent(
-                event="context_loaded",
-                data={"message": f"컨텍스트 로드 완료 ({len(context)} 블록)"}
-            ).to_sse()
+            yield _emit("context_loaded", {"message": f"컨텍스트 로드 완료 ({len(context)} 블록)"})
+            
+            # LLM 프롬프트용 축소 컨텍스트 (대용량 실행 결과는 요약으로 대체)
+            prompt_context = trim_context_blocks(context)
             
-            # 2. 입력 분류
+            # 2. 입력 분류 (턴당 1회 호출)
             classification_category = self.classification_service.classify(
                 request.message,
-                context
+                prompt_context
             )
             
+            if self.classification_service.is_degraded():
+                yield _emit("degraded", {"message": _DEGRADED_MESSAGE})
+                yield _emit("error", {"error": _DEGRADED_MESSAGE})
+                return
+            
             if not classification_category:
-                yield StreamEvent(
-                    event="error",
-                    data={"error": "분류 실패"}
-                ).to_sse()
+                yield _emit("error", {"error": "분류 실패"})
                 return
             
             category = classification_category
-            yield StreamEvent(
-                event="classification",
-                data={"category": category}
-            ).to_sse()
+            yield _emit("classification", {"category": category})
             
             # 3. 카테고리별 처리
             result = self._process_by_category(
                 category=category,
                 user_input=request.message,
                 user_id=request.user_id,
-                context_blocks=context
+                context_blocks=context,
+                prompt_context_blocks=prompt_context
             )
             
+            # LLM 장애로 처리하지 못한 경우 안내 이벤트 (프론트엔드에서 응답 대신 표시)
+            if not result.get('success') and self.classification_service.is_degraded():
+                yield _emit("degraded", {"message": result.get('message') or _DEGRADED_MESSAGE})
+            
             # 4. 결과 스트리밍
             for event in self._stream_result(result, category):
                 yield event
@@ -100,31 +163,25 @@ class ChatService:
             if final_result_event:
                 yield final_result_event
                 
-            # 5. 대화 저장 (ContextBlock 기반)
-            save_result = self._save_context_block(
+            # 5. 대화 저장 (ContextBlock 기반) - 완료 이벤트를 지연시키지 않도록 백그라운드 실행
+            save_future = _chat_executor.submit(
+                self._save_context_block,
                 user_id=request.user_id,
                 category=category,
                 result=result
             )
+            save_future.add_done_callback(_log_save_failure)
             
-            if save_result.get('success'):
-                yield StreamEvent(
-                    event="saved",
-                    data={"message": "대화가 저장되었습니다"}
-                ).to_sse()
+            # 완료 이벤트 전에 저장이 끝난 경우에만 알림 (best-effort, 저장을 기다리지 않음)
+            if save_future.done() and save_future.result().get('success'):
+                yield _emit("saved", {"message": "대화가 저장되었습니다"})
             
             # 6. 완료 이벤트
-            yield StreamEvent(
-                event="complete",
-                data={"message": "대화 처리 완료"}
-            ).to_sse()
+            yield _emit("complete", {"message": "대화 처리 완료"})
             
         except Exception as e:
             logger.error(f"대화 처리 중 오류: {str(e)}")
-            yield StreamEvent(
-                event="error",
-                data={"error": str(e)}
-            ).to_sse()
+            yield _emit("error", {"error": str(e)})
     
     def load_context(
         self, 
@@ -142,11 +199,24 @@ class ChatService:
             컨텍스트 블록 리스트
         """
         try:
+            with self._ctx_lock:
+                cached = self._ctx_cache.get(user_id)
+            if cached:
+                fetched_at, blocks, fetched_limit = cached
+                # 같은 limit 이하이거나, 전체 이력이 이미 캐시된 경우 재사용
+                # (len(blocks) >= limit만 보면 이력이 limit 미만인 사용자는 매번 재조회하게 됨)
+                if (time.monotonic() - fetched_at < self._ctx_ttl
+                        and (limit <= fetched_limit or len(blocks) < fetched_limit)):
+                    return blocks[:limit]
+            
             result = self.chat_repository.get_conversation_with_context(user_id, limit)
             
-            if result.get('success') and result.get('context_blocks'):
+            if result.get('success'):
                 # ChatRepository는 이미 ContextBlock 객체 리스트를 반환
-                return result['context_blocks']
+                blocks = result.get('context_blocks') or []
+                with self._ctx_lock:
+                    self._ctx_cache[user_id] = (time.monotonic(), blocks, limit)
+                return list(blocks)
             
             return []
             
@@ -159,7 +229,8 @@ class ChatService:
         category: str,
         user_input: str,
         user_id: str,
-        context_blocks: List[ContextBlock]
+        context_blocks: List[ContextBlock],
+        prompt_context_blocks: Optional[List[ContextBlock]] = None
     ) -> Dict[str, Any]:
         """
         카테고리별 처리 라우팅
@@ -168,22 +239,24 @@ class ChatService:
             category: 입력 카테고리
             user_input: 사용자 입력
             user_id: 사용자 ID
-            context_blocks: 컨텍스트 블록
+            context_blocks: 컨텍스트 블록 (원본, 데이터 분석용)
+            prompt_context_blocks: 실행 결과가 요약된 컨텍스트 블록 (쿼리/메타데이터 프롬프트용)
             
         Returns:
             처리 결과
         """
+        if prompt_context_blocks is None:
+            prompt_context_blocks = context_blocks
+        
         try:
             if category == "query_request":
                 # QueryRequest 생성 (user_id 필수)
-                from features.query_processing.models import QueryRequest
-                
                 query_request = QueryRequest(
                     user_id=user_id,
                     query=user_input
                 )
                 
-                query_result = self.query_service.process_sql_query(query_request, context_blocks)
+                query_result = self.query_service.process_sql_query(query_request, prompt_context_blocks)
                 
                 # QueryResult를 ChatService 형식으로 변환
                 return {
@@ -192,19 +265,15 @@ class ChatService:
                     'message': query_result.context_block.assistant_response if query_result.context_block else '',
                     'data': query_result.data,
                     'generated_query': query_result.generated_query,
+                    'row_count': query_result.row_count,
                     'context_block': query_result.context_block,
                     'error': query_result.error
                 }
             
             elif category == "data_analysis":
                 # AnalysisRequest 생성
-                from features.data_analysis.models import AnalysisRequest
-                from core.models import ContextBlock, BlockType
-                import uuid
-                from datetime import datetime, timezone
-                
                 analysis_context_block = ContextBlock(
-                    block_id=str(uuid.uuid4()),
+                    block_id=uuid.uuid4().hex,
                     user_id=user_id,
                     timestamp=datetime.now(timezone.utc),
                     block_type=BlockType.ANALYSIS,
@@ -221,22 +290,32 @@ class ChatService:
                     context_blocks=context_blocks
                 )
                 
-                analysis_result = self.analysis_service.process_analysis(analysis_request)
+                # 분석할 데이터가 없으면 LLM 호출 없이 안내 응답 반환
+                precheck_result = self.analysis_service.precheck(analysis_request)
+                if precheck_result is not None:
+                    return {
+                        'success': precheck_result.success,
+                        'category': category,
+                        'message': precheck_result.analysis_content,
+                        'data': None,
+                        'context_block': precheck_result.context_block,
+                        'error': precheck_result.error
+                    }
                 
-                # AnalysisResult를 ChatService 형식으로 변환
+                # 분석 텍스트는 생성되는 대로 스트리밍 (_stream_result에서 소비)
                 return {
-                    'success': analysis_result.success,
+                    'success': True,
                     'category': category,
-                    'message': analysis_result.analysis_content,
+                    'stream': self.analysis_service.process_analysis_stream(analysis_request),
+                    'message': '',
                     'data': None,  # 분석 결과는 보통 텍스트 응답
-                    'context_block': analysis_result.context_block,
-                    'error': analysis_result.error
+                    'context_block': analysis_context_block
                 }
             
             elif category == "metadata_request":
                 return self.query_service.get_metadata_info(
                     user_input=user_input,
-                    context_blocks=context_blocks
+                    context_blocks=prompt_context_blocks
                 )
             
             elif category == "guide_request":
@@ -267,7 +346,7 @@ class ChatService:
         self,
         result: Dict[str, Any],
         category: str
-    ) -> Generator[str, None, None]:
+    ) -> Generator[bytes, None, None]:
         """
         결과를 SSE 이벤트로 스트리밍
         
@@ -279,38 +358,44 @@ class ChatService:
             SSE 형식 이벤트
         """
         if not result.get('success'):
-            yield StreamEvent(
-                event="error",
-                data={"error": result.get('error', '처리 실패')}
-            ).to_sse()
+            yield _emit("error", {"error": result.get('error', '처리 실패')})
             return
         
+        # 토큰 스트리밍 (데이터 분석)
+        if result.get('stream'):
+            chunks = []
+            try:
+                for chunk in result.pop('stream'):
+                    chunks.append(chunk)
+                    yield _emit("message_chunk", {"delta": chunk})
+            except Exception as e:
+                logger.error(f"응답 스트리밍 중 오류: {str(e)}")
+                result['success'] = False
+                result['error'] = str(e)
+                yield _emit("error", {"error": str(e)})
+                return
+            
+            # 최종 결과 이벤트와 저장에서 사용할 전체 응답
+            result['message'] = "".join(chunks)
+            yield _emit("message_end", {"content": result['message']})
+        
         # 메시지 스트리밍
-        if result.get('message'):
-            yield StreamEvent(
-                event="message",
-                data={"content": result['message']}
-            ).to_sse()
+        elif result.get('message'):
+            yield _emit("message", {"content": result['message']})
         
         # SQL 스트리밍 (쿼리 요청인 경우)
         if category == "query_request" and result.get('generated_query'):
-            yield StreamEvent(
-                event="sql",
-                data={"sql": result['generated_query']}
-            ).to_sse()
+            yield _emit("sql", {"sql": result['generated_query']})
         
         # 데이터 스트리밍
         if result.get('data'):
-            yield StreamEvent(
-                event="data",
-                data={"results": result['data']}
-            ).to_sse()
+            yield _emit("data", {"results": result['data']})
     
     def _create_final_result_event(
         self,
         result: Dict[str, Any],
         category: str
-    ) -> Optional[str]:
+    ) -> Optional[bytes]:
         """
         프론트엔드 호환을 위한 최종 결과 이벤트 생성
         
@@ -325,26 +410,18 @@ class ChatService:
             return None
         
         # 카테고리에 따른 결과 타입 매핑
-        result_type_mapping = {
-            "query_request": "query_result",
-            "data_analysis": "analysis_result", 
-            "metadata_request": "metadata_result",
-            "guide_request": "guide_result",
-            "out_of_scope": "out_of_scope_result"
-        }
-        
-        result_type = result_type_mapping.get(category, "unknown_result")
+        result_type = _RESULT_TYPE_MAPPING.get(category, "unknown_result")
         
         # 최종 결과 구성
         final_result_data = {
             "success": True,
-            "request_id": f"req_{int(__import__('time').time())}",
+            "request_id": f"req_{int(time.time())}_{secrets.token_hex(6)}",
             "result": {
                 "type": result_type,
                 "content": result.get('message', ''),
                 "generated_sql": result.get('generated_query'),
                 "data": result.get('data'),
-                "row_count": len(result['data']) if result.get('data') and isinstance(result['data'], list) else None
+                "row_count": result.get('row_count') if result.get('data') else None
             },
             "performance": {
                 "execution_time_ms": 0  # 실제 측정값으로 대체 필요시
@@ -359,10 +436,7 @@ class ChatService:
         if final_result_data["result"]["row_count"] is None:
             del final_result_data["result"]["row_count"]
         
-        return StreamEvent(
-            event="result",
-            data=final_result_data
-        ).to_sse()
+        return _emit("result", final_result_data)
     
     def _save_context_block(
         self,
@@ -400,24 +474,31 @@ class ChatService:
         """ContextBlock을 직접 BigQuery에 저장"""
         try:
             # ChatRepository의 save_context_block 메서드 사용
-            return self.chat_repository.save_context_block(context_block)
+            save_result = self.chat_repository.save_context_block(context_block)
+            
+            if save_result.get('success'):
+                self._append_cached_context(context_block)
+            
+            return save_result
                 
         except Exception as e:
             logger.error(f"ContextBlock 직접 저장 중 오류: {str(e)}")
             return {'success': False, 'error': f'ContextBlock 저장 실패: {str(e)}'}
     
-    def _get_guide_message(self) -> str:
+    def _append_cached_context(self, context_block: ContextBlock) -> None:
+        """저장된 블록을 컨텍스트 캐시에 반영 (무효화 대신 캐시 유지)"""
+        with self._ctx_lock:
+            cached = self._ctx_cache.get(context_block.user_id)
+            if not cached:
+                return
+            fetched_at, blocks, fetched_limit = cached
+            # 조회는 오래된 순으로 limit개를 반환하므로, 이력이 limit 미만일 때만 결과가 바뀜
+            if len(blocks) < fetched_limit:
+                self._ctx_cache[context_block.user_id] = (
+                    fetched_at, blocks + [context_block], fetched_limit
+                )
+    
+    @staticmethod
+    def _get_guide_message() -> str:
         """가이드 메시지 반환"""
-        return """
-Analytics Assistant AI 사용 가이드:
-
-**사용 가능한 기능:**
-1. **데이터 조회**: "지난달 매출은?", "어제 사용자 수 조회"
-2. **데이터 분석**: "매출 추이 분석", "사용자 행동 패턴 분석"
-3. **메타데이터 조회**: "테이블 구조 보여줘", "컬럼 정보 확인"
-
-**팁:**
-- 구체적인 기간과 지표를 명시하면 더 정확한 결과를 얻을 수 있습니다
-- 이전 대화 내용을 참조하여 연속적인 질문이 가능합니다
-- SQL을 직접 확인하고 수정을 요청할 수 있습니다
-"""
\ No newline at end of file
+        return _GUIDE_MESSAGE
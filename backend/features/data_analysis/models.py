@@ -7,7 +7,7 @@ from typing import Optional, Dict, Any, List
 from core.models import ContextBlock
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisRequest:
     """데이터 분석 요청"""
     user_id: str
@@ -16,7 +16,7 @@ class AnalysisRequest:
     context_blocks: List[ContextBlock] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """데이터 분석 결과"""
     success: bool
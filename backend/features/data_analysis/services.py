@@ -2,7 +2,7 @@
 Data Analysis Service - 데이터 분석 전담 서비스
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Iterator
 from core.models import BlockType, ContextBlock, context_blocks_to_llm_format
 from .models import AnalysisRequest, AnalysisResult
 from utils.logging_utils import get_logger
@@ -10,6 +10,18 @@ from features.llm.models import AnalysisRequest as LLMAnalysisRequest
 
 logger = get_logger(__name__)
 
+# LLM 장애로 서킷 브레이커가 열렸을 때의 분석 응답
+_DEGRADED_ANALYSIS_MESSAGE = "현재 AI 서비스 요청이 많아 분석할 수 없습니다. 잠시 후 다시 시도해주세요."
+
+
+def _has_analyzable_data(context_blocks: Optional[List[ContextBlock]]) -> bool:
+    """컨텍스트에 분석할 쿼리 실행 결과가 있는지 확인"""
+    for block in context_blocks or []:
+        execution_result = block.execution_result
+        if execution_result and execution_result.get("data"):
+            return True
+    return False
+
 
 class AnalysisService:
     """데이터 분석 전담 서비스 - LLM을 사용한 분석 응답 생성 (단순화)"""
@@ -18,6 +30,22 @@ class AnalysisService:
         self.llm_service = llm_service
         self.chat_repository = chat_repository  # ContextBlock 저장용으로만 사용
     
+    def precheck(self, request: AnalysisRequest) -> Optional[AnalysisResult]:
+        """
+        LLM 호출 전 분석 가능 여부 확인
+        
+        Args:
+            request: 분석 요청
+            
+        Returns:
+            Optional[AnalysisResult]: 분석 없이 바로 반환할 결과 (분석 가능하면 None)
+        """
+        if not _has_analyzable_data(request.context_blocks):
+            return self._generate_no_data_response(request)
+        if self.llm_service.is_degraded():
+            return self._generate_degraded_response(request)
+        return None
+    
     def process_analysis(self, request: AnalysisRequest) -> AnalysisResult:
         """
         데이터 분석 처리
@@ -28,6 +56,10 @@ class AnalysisService:
         Returns:
             AnalysisResult: 분석 결과
         """
+        precheck_result = self.precheck(request)
+        if precheck_result is not None:
+            return precheck_result
+        
         # ContextBlock 상태를 processing으로 변경
         request.context_block.status = "processing"
         request.context_block.block_type = BlockType.ANALYSIS
@@ -75,6 +107,9 @@ class AnalysisService:
                 
         except Exception as e:
             logger.error(f"데이터 분석 중 오류: {str(e)}")
+            if self.llm_service.is_degraded():
+                return self._generate_degraded_response(request)
+            
             request.context_block.status = "failed"
             
             return AnalysisResult(
@@ -84,6 +119,45 @@ class AnalysisService:
                 error=str(e)
             )
     
+    def process_analysis_stream(self, request: AnalysisRequest) -> Iterator[str]:
+        """
+        데이터 분석 스트리밍 처리
+        
+        생성되는 분석 텍스트 조각을 그대로 전달하고, 완료 시 누적된 전체 응답을
+        ContextBlock에 기록 (precheck 통과 후 호출)
+        
+        Args:
+            request: 분석 요청 (ContextBlock 포함)
+            
+        Yields:
+            str: 분석 텍스트 조각
+        """
+        request.context_block.status = "processing"
+        request.context_block.block_type = BlockType.ANALYSIS
+        
+        chunks = []
+        try:
+            logger.info(f"📊 데이터 분석 스트리밍 시작: {request.query[:50]}...")
+            
+            llm_request = LLMAnalysisRequest(
+                user_question=request.query,
+                context_blocks=request.context_blocks or [],
+                additional_context=None
+            )
+            
+            for chunk in self.llm_service.stream_analyze_data(llm_request):
+                chunks.append(chunk)
+                yield chunk
+            
+            request.context_block.assistant_response = "".join(chunks)
+            request.context_block.status = "completed"
+            
+        except Exception as e:
+            logger.error(f"데이터 분석 스트리밍 중 오류: {str(e)}")
+            request.context_block.assistant_response = "".join(chunks)
+            request.context_block.status = "failed"
+            raise
+    
     def _generate_no_data_response(self, request: AnalysisRequest) -> AnalysisResult:
         """
         이전 데이터가 없을 때의 응답 생성
@@ -102,4 +176,24 @@ class AnalysisService:
             success=True,
             analysis_content=content,
             context_block=request.context_block
-        )
\ No newline at end of file
+        )
+    
+    def _generate_degraded_response(self, request: AnalysisRequest) -> AnalysisResult:
+        """
+        LLM 서킷 브레이커가 열렸을 때의 응답 생성
+        
+        Args:
+            request: 분석 요청
+            
+        Returns:
+            AnalysisResult: 실패 응답 (안내 메시지 포함)
+        """
+        request.context_block.assistant_response = _DEGRADED_ANALYSIS_MESSAGE
+        request.context_block.status = "failed"
+        
+        return AnalysisResult(
+            success=False,
+            analysis_content=_DEGRADED_ANALYSIS_MESSAGE,
+            context_block=request.context_block,
+            error=_DEGRADED_ANALYSIS_MESSAGE
+        )
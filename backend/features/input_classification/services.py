@@ -2,19 +2,146 @@
 Input Classification Service - 입력 분류 전담 서비스
 """
 
-from typing import Dict, Any, List
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+import xxhash
 from core.models import ContextBlock
 from utils.logging_utils import get_logger
-from features.llm.models import ClassificationRequest
+from features.llm.models import ClassificationRequest, ClassificationResponse
 
 logger = get_logger(__name__)
 
+# LLM 호출 실패 시 LLMService가 돌려주는 기본 응답의 confidence (캐시 제외 대상)
+_FAILURE_CONFIDENCE = 0.1
+
+# LLM 호출 없이 바로 분류 가능한 명백한 입력 (메시지 전체가 일치할 때만 적용)
+_GUIDE_RE = re.compile(r"^\s*(help|guide|사용법|도움말|\?)\s*[?!.]*\s*$", re.IGNORECASE)
+_OUT_OF_SCOPE_RE = re.compile(
+    r"^\s*(hi|hello|thanks|thank you|안녕|안녕하세요|고마워|고마워요|감사|감사합니다)\s*[?!.~]*\s*$",
+    re.IGNORECASE
+)
+
+# 유사 입력 캐시 설정 (한국어 입력이 대부분이라 다국어 임베딩 모델 사용)
+_SIM_MODEL_NAME = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+_SIM_THRESHOLD = 0.92
+_SIM_CAPACITY = 4096
+# 유사 입력 재사용은 확신도가 높은 분류 결과에만 허용 (애매한 분류의 전파 방지)
+_SIM_MIN_CONFIDENCE = 0.9
+_WORD_RE = re.compile(r"\w+")
+
+
+def _words_covered(a: List[str], b: List[str]) -> bool:
+    """a의 모든 단어가 b에 (접두어 기준으로) 대응되는지 확인 (조사/복수형 차이는 허용)"""
+    return all(any(x.startswith(y) or y.startswith(x) for y in b) for x in a)
+
+
+class _SimilarityCache:
+    """
+    임베딩 코사인 유사도 기반 분류 응답 캐시 (동일 컨텍스트 내 표현만 다른 입력 재사용)
+    
+    유사도만으로는 "테이블 보여줘"/"테이블 개수 보여줘"처럼 의도가 다른 입력이 합쳐질 수 있어,
+    확신도 높은 응답만 저장하고 새로 추가된 단어가 있는 입력은 재사용하지 않음
+    """
+    
+    def __init__(self, model_name: str = _SIM_MODEL_NAME, threshold: float = _SIM_THRESHOLD,
+                 capacity: int = _SIM_CAPACITY):
+        self.model_name = model_name
+        self.threshold = threshold
+        self.capacity = capacity
+        self.enabled = True
+        self._model = None
+        self._vecs = None
+        self._ctx = None
+        self._responses: List[Optional[ClassificationResponse]] = [None] * capacity
+        self._words: List[List[str]] = [[] for _ in range(capacity)]
+        self._size = 0
+        self._next = 0
+        self._lock = threading.Lock()
+    
+    def _ensure_model(self) -> bool:
+        """첫 사용 시 임베딩 모델 로드 (의존성 없으면 비활성화)"""
+        if self._model is not None or not self.enabled:
+            return self.enabled
+        with self._lock:
+            if self._model is None and self.enabled:
+                try:
+                    import numpy as np
+                    from sentence_transformers import SentenceTransformer
+                    model = SentenceTransformer(self.model_name)
+                    dim = model.get_sentence_embedding_dimension()
+                    self._vecs = np.zeros((self.capacity, dim), dtype=np.float32)
+                    self._ctx = np.zeros(self.capacity, dtype=np.int64)
+                    self._model = model
+                    logger.info(f"✅ 유사 입력 분류 캐시 활성화: {self.model_name}")
+                except Exception as e:
+                    logger.warning(f"유사 입력 분류 캐시 비활성화 (모델 로드 실패): {str(e)}")
+                    self.enabled = False
+        return self.enabled
+    
+    def encode(self, message: str):
+        """정규화된 임베딩 벡터 반환 (비활성 시 None)"""
+        if not self._ensure_model():
+            return None
+        return self._model.encode(message, normalize_embeddings=True)
+    
+    def lookup(self, vec, ctx_hash: int, message: str) -> Optional[ClassificationResponse]:
+        """같은 컨텍스트에서 임계값 이상으로 유사하고 단어 구성이 같은 입력의 분류 응답 조회"""
+        words = _WORD_RE.findall(message.lower())
+        with self._lock:
+            if not self._size:
+                return None
+            sims = self._vecs[:self._size] @ vec
+            sims[self._ctx[:self._size] != ctx_hash] = -1.0
+            best = int(sims.argmax())
+            if sims[best] < self.threshold:
+                return None
+            response, cached_words = self._responses[best], self._words[best]
+        if response.confidence < _SIM_MIN_CONFIDENCE:
+            return None
+        if not (_words_covered(words, cached_words) and _words_covered(cached_words, words)):
+            return None
+        return response
+    
+    def add(self, vec, ctx_hash: int, message: str, response: ClassificationResponse) -> None:
+        """분류 응답 저장 (확신도 낮은 응답 제외, 용량 초과 시 가장 오래된 항목부터 덮어씀)"""
+        if response.confidence < _SIM_MIN_CONFIDENCE:
+            return
+        with self._lock:
+            slot = self._next
+            self._vecs[slot] = vec
+            self._ctx[slot] = ctx_hash
+            self._responses[slot] = response
+            self._words[slot] = _WORD_RE.findall(message.lower())
+            self._next = (slot + 1) % self.capacity
+            self._size = min(self._size + 1, self.capacity)
+    
+    def clear(self) -> None:
+        """캐시 초기화 (로드된 모델은 유지)"""
+        with self._lock:
+            self._responses = [None] * self.capacity
+            self._words = [[] for _ in range(self.capacity)]
+            self._size = 0
+            self._next = 0
+
 
 class InputClassificationService:
     """입력 분류 서비스 - 사용자 입력을 카테고리별로 분류"""
     
-    def __init__(self, llm_service):
+    def __init__(self, llm_service, cache_size: int = 1024, similarity_cache: bool = False):
         self.llm_service = llm_service
+        # (정규화된 메시지 해시, 최근 컨텍스트 block_id) → 분류 응답 LRU 캐시
+        self._cls_cache: "OrderedDict[Tuple[str, Tuple[str, ...]], ClassificationResponse]" = OrderedDict()
+        self._cls_cache_size = cache_size
+        self._cls_cache_lock = threading.Lock()
+        # 표현만 다른 유사 입력 재사용 (선택 기능, sentence-transformers 필요)
+        # 주의: 임베딩 유사도는 의도 차이를 보장하지 못해 오분류 응답이 재사용될 수 있음.
+        # 확신도/단어 구성 검사로 완화하지만, 분류 정확도가 중요한 환경에서는 끄고 사용할 것
+        self._sim_cache = _SimilarityCache() if similarity_cache else None
+        # 규칙 기반 즉시 분류 비율 추적 (규칙 튜닝용)
+        self._shortcut_hits = 0
+        self._classify_calls = 0
     
     def classify(self, message: str, context_blocks: List[ContextBlock] = None) -> str:
         """
@@ -28,16 +155,7 @@ class InputClassificationService:
             str: 분류 카테고리 ('query_request', 'data_analysis', 'metadata_request', etc.)
         """
         try:
-            logger.info(f"🔍 입력 분류 중: {message[:50]}...")
-            
-            # ContextBlock을 직접 LLMService에 전달
-            request = ClassificationRequest(
-                user_input=message,
-                context_blocks=context_blocks or []
-            )
-            
-            response = self.llm_service.classify_input(request)
-            
+            response = self._classify_full(message, context_blocks)
             logger.info(f"🏷️ 분류 결과: {response.category}")
             return response.category
             
@@ -58,13 +176,7 @@ class InputClassificationService:
             Dict: 전체 분류 결과
         """
         try:
-            # ContextBlock을 직접 LLMService에 전달
-            request = ClassificationRequest(
-                user_input=message,
-                context_blocks=context_blocks or []
-            )
-            
-            response = self.llm_service.classify_input(request)
+            response = self._classify_full(message, context_blocks)
             
             return {
                 "classification": {"category": response.category},
@@ -78,4 +190,90 @@ class InputClassificationService:
                 "classification": {"category": "query_request"},
                 "confidence": 0.1,
                 "error": str(e)
-            }
\ No newline at end of file
+            }
+    
+    def _classify_full(self, message: str, context_blocks: List[ContextBlock] = None) -> ClassificationResponse:
+        """
+        LLM 분류 응답 조회 (classify/get_classification_details 공용, LRU 캐시 적용)
+        
+        Args:
+            message: 사용자 입력 메시지
+            context_blocks: ContextBlock 리스트
+            
+        Returns:
+            ClassificationResponse: 분류 응답 (캐시된 경우 동일 객체)
+        """
+        shortcut = self._shortcut_category(message)
+        with self._cls_cache_lock:
+            self._classify_calls += 1
+            if shortcut:
+                self._shortcut_hits += 1
+        if shortcut:
+            logger.info(
+                f"⚡ 규칙 기반 분류: {shortcut} "
+                f"(적중률 {self._shortcut_hits}/{self._classify_calls})"
+            )
+            return ClassificationResponse(category=shortcut, confidence=1.0, reasoning="키워드 규칙 일치")
+        
+        cache_key = self._cache_key(message, context_blocks)
+        with self._cls_cache_lock:
+            cached = self._cls_cache.get(cache_key)
+            if cached is not None:
+                self._cls_cache.move_to_end(cache_key)
+                return cached
+        
+        sim_vec = None
+        ctx_hash = hash(cache_key[1])
+        if self._sim_cache is not None:
+            sim_vec = self._sim_cache.encode(message.strip())
+            if sim_vec is not None:
+                similar = self._sim_cache.lookup(sim_vec, ctx_hash, message)
+                if similar is not None:
+                    logger.info(f"♻️ 유사 입력 분류 재사용: {similar.category}")
+                    return similar
+        
+        logger.info(f"🔍 입력 분류 중: {message[:50]}...")
+        
+        # ContextBlock을 직접 LLMService에 전달
+        request = ClassificationRequest(
+            user_input=message,
+            context_blocks=context_blocks or []
+        )
+        
+        response = self.llm_service.classify_input(request)
+        
+        if response.confidence > _FAILURE_CONFIDENCE:
+            with self._cls_cache_lock:
+                self._cls_cache[cache_key] = response
+                if len(self._cls_cache) > self._cls_cache_size:
+                    self._cls_cache.popitem(last=False)
+            if sim_vec is not None:
+                self._sim_cache.add(sim_vec, ctx_hash, message, response)
+        
+        return response
+    
+    def is_degraded(self) -> bool:
+        """LLM 장애로 분류가 차단된 상태인지 확인"""
+        return self.llm_service.is_degraded()
+    
+    def cache_clear(self) -> None:
+        """분류 결과 캐시 초기화"""
+        with self._cls_cache_lock:
+            self._cls_cache.clear()
+        if self._sim_cache is not None:
+            self._sim_cache.clear()
+    
+    @staticmethod
+    def _shortcut_category(message: str) -> Optional[str]:
+        """명백한 가이드/범위 외 입력이면 카테고리 반환, 아니면 None"""
+        if _GUIDE_RE.match(message):
+            return "guide_request"
+        if _OUT_OF_SCOPE_RE.match(message):
+            return "out_of_scope"
+        return None
+    
+    @staticmethod
+    def _cache_key(message: str, context_blocks: List[ContextBlock] = None) -> Tuple[str, Tuple[str, ...]]:
+        """분류 캐시 키 생성 (정규화된 메시지 전체의 해시 + 최근 3개 컨텍스트 block_id)"""
+        recent_ids = tuple(block.block_id for block in (context_blocks or [])[-3:])
+        return xxhash.xxh3_64_hexdigest(message.strip().lower()), recent_ids
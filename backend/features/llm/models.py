@@ -18,14 +18,14 @@ class LLMCategory(Enum):
     OUT_OF_SCOPE = "out_of_scope"
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassificationRequest:
     """입력 분류 요청"""
     user_input: str
     context_blocks: Optional[List[ContextBlock]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassificationResponse:
     """입력 분류 응답"""
     category: str
@@ -33,7 +33,7 @@ class ClassificationResponse:
     reasoning: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SQLGenerationRequest:
     """SQL 생성 요청"""
     user_question: str
@@ -43,7 +43,7 @@ class SQLGenerationRequest:
     schema_info: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SQLGenerationResponse:
     """SQL 생성 응답"""
     sql_query: str
@@ -51,7 +51,7 @@ class SQLGenerationResponse:
     confidence: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisRequest:
     """데이터 분석 요청"""
     user_question: str
@@ -59,7 +59,7 @@ class AnalysisRequest:
     additional_context: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResponse:
     """데이터 분석 응답"""
     analysis: str
@@ -67,14 +67,14 @@ class AnalysisResponse:
     recommendations: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GuideRequest:
     """가이드 요청"""
     question: str
     context: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OutOfScopeRequest:
     """범위 외 요청"""
     question: str
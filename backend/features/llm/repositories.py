@@ -3,13 +3,33 @@ LLM Repositories
 LLM 프로바이더별 데이터 접근 계층
 """
 
+import atexit
+import time
 import anthropic
-from typing import Dict, Any, Optional, List
+import httpx
+import pybreaker
+from typing import Dict, Any, Optional, List, Iterator, Tuple
 from core.llm.interfaces import BaseLLMRepository, LLMRequest, LLMResponse
 from utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+# 가용성 확인 결과 유지 시간 (초)
+_AVAILABILITY_TTL = 30.0
+
+# Anthropic API 연결 설정 (HTTP/2 다중화 + 넉넉한 keep-alive 풀)
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+# 연속 5회 실패 시 30초간 Anthropic 호출을 즉시 거부
+# (잘못된 요청 오류와 클라이언트 연결 종료로 인한 스트리밍 중단은 장애로 보지 않음)
+llm_breaker = pybreaker.CircuitBreaker(
+    fail_max=5,
+    reset_timeout=30,
+    exclude=[anthropic.BadRequestError, GeneratorExit],
+    name="anthropic"
+)
+
 
 class AnthropicRepository(BaseLLMRepository):
     """Anthropic Claude API Repository"""
@@ -26,7 +46,14 @@ class AnthropicRepository(BaseLLMRepository):
         self.default_model = default_model
         
         try:
-            self.client = anthropic.Anthropic(api_key=api_key)
+            self.client = anthropic.Anthropic(
+                api_key=api_key,
+                max_retries=2,
+                http_client=httpx.Client(http2=True, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+            )
+            atexit.register(self.client.close)
+            # 가용성 확인 결과 캐시: (확인 시각, 결과)
+            self._avail_cache: Optional[Tuple[float, bool]] = None
             logger.info("✅ Anthropic Repository 초기화 완료")
         except Exception as e:
             logger.error(f"❌ Anthropic Repository 초기화 실패: {str(e)}")
@@ -44,57 +71,111 @@ class AnthropicRepository(BaseLLMRepository):
         """
         try:
             # Anthropic API 호출
-            kwargs = {
-                "model": request.model or self.default_model,
-                "max_tokens": request.max_tokens,
-                "temperature": request.temperature,
-                "messages": request.messages
-            }
-            
-            # system 메시지가 있으면 추가
-            if request.system:
-                kwargs["system"] = request.system
-            
-            response = self.client.messages.create(**kwargs)
-            
-            # 응답 내용 추출
-            content = response.content[0].text if response.content else ""
-            
-            # Usage 정보 추출 (있는 경우)
-            usage = None
-            if hasattr(response, 'usage') and response.usage:
-                usage = {
-                    "input_tokens": getattr(response.usage, 'input_tokens', 0),
-                    "output_tokens": getattr(response.usage, 'output_tokens', 0)
-                }
-            
-            return LLMResponse(
-                content=content,
-                usage=usage,
-                model=response.model if hasattr(response, 'model') else request.model,
-                finish_reason=getattr(response, 'stop_reason', None)
+            response = llm_breaker.call(
+                self.client.messages.create, **self._build_message_kwargs(request)
             )
             
+            return self._to_llm_response(response, request)
+            
         except Exception as e:
             logger.error(f"❌ Anthropic API 호출 실패: {str(e)}")
             raise
     
-    def is_available(self) -> bool:
+    def stream_prompt(self, request: LLMRequest) -> Iterator[str]:
         """
-        서비스 가용성 확인
-        간단한 API 호출로 서비스 상태 확인
+        프롬프트 스트리밍 실행
+        
+        Args:
+            request: LLM 요청 객체
+            
+        Yields:
+            str: 생성되는 응답 텍스트 조각
         """
         try:
-            test_request = LLMRequest(
-                model=self.default_model,
-                messages=[{"role": "user", "content": "Hello"}],
-                max_tokens=10
-            )
-            response = self.execute_prompt(test_request)
-            return bool(response.content)
+            # 스트림이 끝까지 소비되거나 실패할 때 성공/실패를 서킷 브레이커에 기록
+            with llm_breaker.calling():
+                with self.client.messages.stream(**self._build_message_kwargs(request)) as stream:
+                    yield from stream.text_stream
+                
         except Exception as e:
-            logger.warning(f"Anthropic 서비스 가용성 확인 실패: {str(e)}")
-            return False
+            logger.error(f"❌ Anthropic 스트리밍 호출 실패: {str(e)}")
+            raise
+    
+    @staticmethod
+    def _to_llm_response(response, request: LLMRequest) -> LLMResponse:
+        """Anthropic 응답 객체를 LLMResponse로 변환"""
+        # 응답 내용 추출
+        content = response.content[0].text if response.content else ""
+        
+        # Usage 정보 추출 (있는 경우)
+        usage = None
+        try:
+            response_usage = response.usage
+            usage = {
+                "input_tokens": response_usage.input_tokens,
+                "output_tokens": response_usage.output_tokens
+            }
+        except AttributeError:
+            pass
+        
+        return LLMResponse(
+            content=content,
+            usage=usage,
+            model=getattr(response, 'model', request.model),
+            finish_reason=getattr(response, 'stop_reason', None)
+        )
+    
+    def _build_message_kwargs(self, request: LLMRequest) -> Dict[str, Any]:
+        """LLMRequest를 Anthropic messages API 인자로 변환"""
+        kwargs = {
+            "model": request.model or self.default_model,
+            "max_tokens": request.max_tokens,
+            "temperature": request.temperature,
+            "messages": request.messages
+        }
+        
+        # system 메시지가 있으면 추가 (캐시 제어가 포함된 블록 목록 우선)
+        if request.system_blocks:
+            kwargs["system"] = request.system_blocks
+        elif request.system:
+            kwargs["system"] = request.system
+        
+        return kwargs
+    
+    def is_available(self, force: bool = False) -> bool:
+        """
+        서비스 가용성 확인
+        최소 토큰 API 호출로 서비스 상태를 확인하고 결과를 잠시 캐시
+        
+        Args:
+            force: True면 캐시를 무시하고 다시 확인
+        """
+        cached = self._avail_cache
+        if not force and cached and time.monotonic() - cached[0] < _AVAILABILITY_TTL:
+            return cached[1]
+        
+        # 서킷 브레이커가 열려 있으면 호출 없이 사용 불가로 판단
+        if self.is_degraded():
+            available = False
+        else:
+            try:
+                test_request = LLMRequest(
+                    model=self.default_model,
+                    messages=[{"role": "user", "content": "."}],
+                    max_tokens=1
+                )
+                response = self.execute_prompt(test_request)
+                available = response.finish_reason is not None or bool(response.content)
+            except Exception as e:
+                logger.warning(f"Anthropic 서비스 가용성 확인 실패: {str(e)}")
+                available = False
+        
+        self._avail_cache = (time.monotonic(), available)
+        return available
+    
+    def is_degraded(self) -> bool:
+        """서킷 브레이커가 열려 Anthropic 호출을 차단 중인지 확인"""
+        return llm_breaker.current_state == pybreaker.STATE_OPEN
     
     def get_model_info(self) -> Dict[str, Any]:
         """
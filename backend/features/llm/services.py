@@ -3,13 +3,23 @@ LLM Service
 LLM 관련 비즈니스 로직을 담당하는 서비스
 """
 
-import json
-from typing import Dict, Any, List, Optional
-from core.llm.interfaces import BaseLLMRepository, LLMRequest
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Iterator, Tuple
+import orjson
+import pybreaker
+import xxhash
+from cachetools import TTLCache
+from core.llm.interfaces import BaseLLMRepository, LLMRequest, LLMResponse
 from core.prompts import prompt_manager
 from core.prompts.fallbacks import FallbackPrompts
-from core.models.context import ContextBlock, context_blocks_to_llm_format
-from core.config.llm_config import LLMConfigManager
+from core.models.context import (
+    ContextBlock,
+    context_blocks_to_llm_format,
+    context_blocks_to_complete_format,
+    create_analysis_context
+)
+from core.config.llm_config import LLMConfigManager, get_llm_config_manager
 from utils.logging_utils import get_logger
 from features.metasync.repositories import MetaSyncRepository
 from .models import (
@@ -28,9 +38,96 @@ from .utils import (
 logger = get_logger(__name__)
 
 
+class _LockedLRU:
+    """스레드 안전한 소형 LRU 캐시 (ContextBlock 구성 -> 직렬화 문자열)"""
+    
+    def __init__(self, maxsize: int):
+        self._data: "OrderedDict[Any, str]" = OrderedDict()
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+    
+    def get(self, key) -> Optional[str]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+    
+    def put(self, key, value: str) -> None:
+        with self._lock:
+            self._data[key] = value
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+
+def _blocks_key(context_blocks: List[ContextBlock]) -> Tuple[Tuple[str, str], ...]:
+    """저장된 블록은 변하지 않으므로 (block_id, status) 튜플로 블록 구성을 식별"""
+    return tuple((block.block_id, block.status) for block in context_blocks)
+
+
+# 프롬프트용 대화 컨텍스트 문자열 캐시: 최근 블록 구성 -> 포맷 결과
+_PROMPT_CONTEXT_CACHE = _LockedLRU(maxsize=512)
+# 분석용 컨텍스트 JSON 캐시 (결과 행 전체를 포함하므로 작게 유지)
+_ANALYSIS_CONTEXT_CACHE = _LockedLRU(maxsize=32)
+
+# 대화 컨텍스트 프롬프트용 문자열 상수
+_EMPTY_CTX_MSG = "[이전 대화 없음]"
+_ROLE_MAP = {"user": "사용자", "assistant": "AI"}
+
+# 토큰 수 추정용 문자/토큰 비율 (정확한 토크나이저 대신 사용하는 근사치)
+_CHARS_PER_TOKEN = 4
+
+
+def _estimate_tokens(text: str) -> int:
+    """문자열 길이 기반 토큰 수 근사"""
+    return len(text) // _CHARS_PER_TOKEN
+
+
+def _format_context_message(idx: int, msg: Dict[str, Any]) -> str:
+    """LLM 포맷 메시지 한 개를 '[번호] 역할: 내용 (실행 정보)' 한 줄로 변환"""
+    content = msg['content']
+    if msg["role"] != "assistant" or "metadata" not in msg:
+        return f"[{idx}] {_ROLE_MAP.get(msg['role'], 'AI')}: {content}"
+    
+    # AI 응답의 경우 실행 통계 정보 추가 (생성된 쿼리, 결과 행 수)
+    query = msg["metadata"].get("generated_query")
+    row_count = msg.get("query_row_count", 0)
+    if query and row_count > 0:
+        return f"[{idx}] AI: {content} (SQL: {query}, 결과: {row_count}개 행)"
+    if query:
+        return f"[{idx}] AI: {content} (SQL: {query})"
+    if row_count > 0:
+        return f"[{idx}] AI: {content} (결과: {row_count}개 행)"
+    return f"[{idx}] AI: {content}"
+
+
+# 이 온도를 넘는 요청은 응답이 매번 달라지는 것을 의도한 것으로 보고 캐시하지 않음
+_RESPONSE_CACHE_MAX_TEMPERATURE = 0.3
+
+
+def _fast_json_object(text: str) -> Optional[Dict[str, Any]]:
+    """첫 '{' ~ 마지막 '}' 구간을 한 번에 파싱 (실패 시 None)"""
+    if not text:
+        return None
+    start = text.find('{')
+    end = text.rfind('}')
+    if start < 0 or end <= start:
+        return None
+    try:
+        data = orjson.loads(text[start:end + 1])
+    except orjson.JSONDecodeError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
 class LLMService:
     """LLM 비즈니스 로직 서비스"""
     
+    __slots__ = (
+        'repository', 'metasync_repository', 'config_manager',
+        '_resp_cache', '_resp_cache_lock', '_metasync_render'
+    )
+    
     def __init__(self, repository: BaseLLMRepository, metasync_repository: MetaSyncRepository, config_manager: Optional[LLMConfigManager] = None):
         """
         LLM Service 초기화
@@ -42,7 +139,12 @@ class LLMService:
         """
         self.repository = repository
         self.metasync_repository = metasync_repository
-        self.config_manager = config_manager or LLMConfigManager()
+        self.config_manager = config_manager or get_llm_config_manager()
+        # 동일 프롬프트 재호출 방지용 응답 캐시 (프롬프트 해시 -> LLMResponse)
+        self._resp_cache: TTLCache = TTLCache(maxsize=2048, ttl=3600)
+        self._resp_cache_lock = threading.Lock()
+        # MetaSync 캐시 데이터 -> 프롬프트용 JSON 문자열 (캐시 데이터 객체가 바뀔 때만 재직렬화)
+        self._metasync_render: Optional[Tuple[Dict[str, Any], str]] = None
         logger.info("✅ LLMService 초기화 완료 (MetaSyncRepository 직접 연동)")
     
     def classify_input(self, request: ClassificationRequest) -> ClassificationResponse:
@@ -50,173 +152,182 @@ class LLMService:
         사용자 입력 분류
         """
         try:
-            # 프롬프트 템플릿 로드
-            system_prompt = prompt_manager.get_prompt(
-                category='classification',
-                template_name='system_prompt',
-                fallback_prompt=FallbackPrompts.classification()
-            )
-            
-            # ContextBlock을 LLM 형식으로 변환
-            context_blocks_formatted = ""
-            if request.context_blocks:
-                context_blocks_formatted = self._format_context_blocks_for_prompt(request.context_blocks)
-            else:
-                context_blocks_formatted = "[이전 대화 없음]"
-            
-            user_prompt = prompt_manager.get_prompt(
-                category='classification',
-                template_name='user_prompt',
-                user_input=request.user_input,
-                context_blocks=context_blocks_formatted,
-                fallback_prompt=f"다음 입력을 분류해주세요: {request.user_input}"
-            )
-            
-            # 설정 관리자에서 classification 설정 가져오기
-            config = self.config_manager.get_config('classification')
-            
-            # LLM 요청 생성
-            llm_request = LLMRequest(
-                model=config.model_id,
-                system=system_prompt,
-                messages=[{"role": "user", "content": user_prompt}],
-                max_tokens=config.max_tokens,
-                temperature=config.temperature
-            )
+            llm_request, config = self._build_classification_llm_request(request)
             
             # LLM 호출
-            response = self.repository.execute_prompt(llm_request)
-            
-            # JSON 응답 파싱
-            result_data = extract_json_from_response(response.content)
+            response = self._cached_execute(llm_request)
             
-            if result_data and isinstance(result_data, dict):
-                # 설정에서 confidence 임계값 가져오기
-                config_confidence = config.confidence or 0.5
-                response_confidence = float(result_data.get('confidence', config_confidence))
-                
-                return ClassificationResponse(
-                    category=result_data.get('category', 'unknown'),
-                    confidence=response_confidence,
-                    reasoning=result_data.get('reasoning')
-                )
-            else:
-                logger.warning("분류 응답을 파싱할 수 없음, 기본값 사용")
-                config_confidence = config.confidence or 0.5
-                return ClassificationResponse(
-                    category='query_request',
-                    confidence=config_confidence,
-                    reasoning="파싱 실패"
-                )
+            return self._parse_classification_response(response.content, config)
                 
         except Exception as e:
-            logger.error(f"입력 분류 중 오류: {sanitize_error_message(str(e))}")
-            # 오류 시 낮은 confidence 사용
+            return self._classification_error_response(e)
+    
+    def _build_classification_llm_request(self, request: ClassificationRequest) -> Tuple[LLMRequest, Any]:
+        """분류용 LLM 요청 및 설정 구성"""
+        # 프롬프트 템플릿 로드
+        system_prompt = prompt_manager.get_prompt(
+            category='classification',
+            template_name='system_prompt',
+            fallback_prompt=FallbackPrompts.classification
+        )
+        
+        # 설정 관리자에서 classification 설정 가져오기
+        config = self.config_manager.get_config('classification')
+        
+        # ContextBlock을 LLM 형식으로 변환
+        context_blocks_formatted = ""
+        if request.context_blocks:
+            context_blocks_formatted = self._format_context_blocks_for_prompt(
+                request.context_blocks, config.max_input_tokens
+            )
+        else:
+            context_blocks_formatted = _EMPTY_CTX_MSG
+        
+        user_prompt = prompt_manager.get_prompt(
+            category='classification',
+            template_name='user_prompt',
+            user_input=request.user_input,
+            context_blocks=context_blocks_formatted,
+            fallback_prompt=f"다음 입력을 분류해주세요: {request.user_input}"
+        )
+        
+        # LLM 요청 생성
+        llm_request = LLMRequest(
+            model=config.model_id,
+            system=system_prompt,
+            messages=[{"role": "user", "content": user_prompt}],
+            max_tokens=config.max_tokens,
+            temperature=config.temperature
+        )
+        return llm_request, config
+    
+    @staticmethod
+    def _parse_classification_response(content: str, config) -> ClassificationResponse:
+        """분류 LLM 응답(JSON) 파싱"""
+        # JSON 응답 파싱 (단일 객체 빠른 경로 → 범용 추출기 폴백)
+        result_data = _fast_json_object(content)
+        if result_data is None:
+            result_data = extract_json_from_response(content)
+        
+        # 설정에서 confidence 임계값 가져오기
+        config_confidence = config.confidence or 0.5
+        
+        if result_data and isinstance(result_data, dict):
+            response_confidence = float(result_data.get('confidence', config_confidence))
+            
             return ClassificationResponse(
-                category='query_request',
+                category=result_data.get('category', 'unknown'),
+                confidence=response_confidence,
+                reasoning=result_data.get('reasoning')
+            )
+        
+        logger.warning("분류 응답을 파싱할 수 없음, 기본값 사용")
+        return ClassificationResponse(
+            category='query_request',
+            confidence=config_confidence,
+            reasoning="파싱 실패"
+        )
+    
+    @staticmethod
+    def _classification_error_response(error: Exception) -> ClassificationResponse:
+        """분류 실패 시 기본 응답"""
+        if isinstance(error, pybreaker.CircuitBreakerError):
+            logger.warning("LLM 서킷 브레이커 열림 - 분류 생략")
+            return ClassificationResponse(
+                category='out_of_scope',
                 confidence=0.1,
-                reasoning=f"오류 발생: {str(e)}"
+                reasoning="LLM 서비스 장애로 분류 생략"
             )
+        
+        logger.error(f"입력 분류 중 오류: {sanitize_error_message(str(error))}")
+        # 오류 시 낮은 confidence 사용
+        return ClassificationResponse(
+            category='query_request',
+            confidence=0.1,
+            reasoning=f"오류 발생: {str(error)}"
+        )
     
     def generate_sql(self, request: SQLGenerationRequest) -> SQLGenerationResponse:
         """
         SQL 생성
         """
         try:
-            # ContextBlock을 프롬프트용 형식으로 변환
-            context_blocks_formatted = ""
-            if request.context_blocks:
-                context_blocks_formatted = self._format_context_blocks_for_prompt(request.context_blocks)
-            else:
-                context_blocks_formatted = "[이전 대화 없음]"
-            
-            # MetaSync 데이터로 템플릿 변수 준비
-            template_vars = self._prepare_sql_template_variables(request, context_blocks_formatted)
-            
-            # 통합된 시스템 프롬프트 사용 (MetaSync 통합 정보)
-            system_prompt = prompt_manager.get_prompt(
-                category='sql_generation',
-                template_name='system_prompt',
-                metasync_info=template_vars['metasync_info'],
-                context_blocks=template_vars['context_blocks'],
-                fallback_prompt=FallbackPrompts.sql_system(request.project_id, request.default_table)
-            )
-            
-            # 통합된 사용자 프롬프트 사용
-            user_prompt = prompt_manager.get_prompt(
-                category='sql_generation',
-                template_name='user_prompt',
-                question=template_vars['question'],
-                fallback_prompt=f"다음 질문에 대한 SQL을 생성해주세요: {request.user_question}"
-            )
-            
-            # 설정 관리자에서 sql_generation 설정 가져오기
-            config = self.config_manager.get_config('sql_generation')
-            
-            # LLM 요청
-            llm_request = LLMRequest(
-                model=config.model_id,
-                system=system_prompt,
-                messages=[{"role": "user", "content": user_prompt}],
-                max_tokens=config.max_tokens,
-                temperature=config.temperature
-            )
-            
-            response = self.repository.execute_prompt(llm_request)
-            
-            # SQL 정리
-            cleaned_sql = clean_sql_response(response.content)
-            
-            # 설정에서 confidence 가져오기
-            sql_confidence = config.confidence or 0.8
-            
-            return SQLGenerationResponse(
-                sql_query=cleaned_sql,
-                explanation=None,  # 필요시 별도 추출 로직 구현
-                confidence=sql_confidence
-            )
+            llm_request, config = self._build_sql_llm_request(request)
+            response = self._cached_execute(llm_request)
+            return self._to_sql_response(response.content, config)
             
         except Exception as e:
             logger.error(f"SQL 생성 중 오류: {sanitize_error_message(str(e))}")
             raise
     
+    def _build_sql_llm_request(self, request: SQLGenerationRequest) -> Tuple[LLMRequest, Any]:
+        """SQL 생성용 LLM 요청 및 설정 구성"""
+        # 설정 관리자에서 sql_generation 설정 가져오기
+        config = self.config_manager.get_config('sql_generation')
+        
+        # ContextBlock을 프롬프트용 형식으로 변환
+        context_blocks_formatted = ""
+        if request.context_blocks:
+            context_blocks_formatted = self._format_context_blocks_for_prompt(
+                request.context_blocks, config.max_input_tokens
+            )
+        else:
+            context_blocks_formatted = _EMPTY_CTX_MSG
+        
+        # MetaSync 데이터로 템플릿 변수 준비
+        template_vars = self._prepare_sql_template_variables(request, context_blocks_formatted)
+        
+        # 통합된 시스템 프롬프트 사용 (MetaSync 통합 정보)
+        # 요청마다 바뀌는 대화 컨텍스트/질문은 사용자 프롬프트로 보내 system 전체를 캐시 가능한 정적 접두부로 유지
+        system_prompt = prompt_manager.get_prompt(
+            category='sql_generation',
+            template_name='system_prompt',
+            metasync_info=template_vars['metasync_info'],
+            fallback_prompt=lambda: FallbackPrompts.sql_system(request.project_id, request.default_table)
+        )
+        system_blocks = self._build_cached_system_blocks(system_prompt)
+        
+        # 통합된 사용자 프롬프트 사용
+        user_prompt = prompt_manager.get_prompt(
+            category='sql_generation',
+            template_name='user_prompt',
+            context_blocks=template_vars['context_blocks'],
+            question=template_vars['question'],
+            fallback_prompt=lambda: f"{template_vars['context_blocks']}\n\n다음 질문에 대한 SQL을 생성해주세요: {request.user_question}"
+        )
+        
+        # LLM 요청
+        llm_request = LLMRequest(
+            model=config.model_id,
+            system=system_prompt,
+            system_blocks=system_blocks,
+            messages=[{"role": "user", "content": user_prompt}],
+            max_tokens=config.max_tokens,
+            temperature=config.temperature
+        )
+        return llm_request, config
+    
+    @staticmethod
+    def _to_sql_response(content: str, config) -> SQLGenerationResponse:
+        """LLM 응답을 SQL 생성 응답으로 변환"""
+        # SQL 정리
+        cleaned_sql = clean_sql_response(content)
+        
+        # 설정에서 confidence 가져오기
+        sql_confidence = config.confidence or 0.8
+        
+        return SQLGenerationResponse(
+            sql_query=cleaned_sql,
+            explanation=None,  # 필요시 별도 추출 로직 구현
+            confidence=sql_confidence
+        )
+    
     def analyze_data(self, request: AnalysisRequest) -> AnalysisResponse:
         """
         데이터 분석 - ContextBlock을 완전한 컨텍스트 단위로 처리
         """
         try:
-            # ContextBlock을 완전한 컨텍스트 단위로 처리
-            context_json = self._prepare_analysis_context_json(request.context_blocks)
-            
-            # 프롬프트 준비
-            system_prompt = prompt_manager.get_prompt(
-                category='data_analysis',
-                template_name='system_prompt',
-                fallback_prompt="데이터를 분석하고 인사이트를 제공하는 전문가입니다."
-            )
-            
-            # ContextBlock 완전한 단위로 전달 (설계 원칙 준수)
-            user_prompt = prompt_manager.get_prompt(
-                category='data_analysis',
-                template_name='user_prompt',
-                context_json=context_json,  # 단일 변수로 통합
-                question=request.user_question,
-                fallback_prompt=FallbackPrompts.analysis(request.user_question, context_json)
-            )
-            
-            # 설정 관리자에서 data_analysis 설정 가져오기
-            config = self.config_manager.get_config('data_analysis')
-            
-            # LLM 요청
-            llm_request = LLMRequest(
-                model=config.model_id,
-                system=system_prompt,
-                messages=[{"role": "user", "content": user_prompt}],
-                max_tokens=config.max_tokens,
-                temperature=config.temperature
-            )
-            
-            response = self.repository.execute_prompt(llm_request)
+            response = self.repository.execute_prompt(self._build_analysis_llm_request(request))
             
             return AnalysisResponse(
                 analysis=response.content,
@@ -228,36 +339,92 @@ class LLMService:
             logger.error(f"데이터 분석 중 오류: {sanitize_error_message(str(e))}")
             raise
     
+    def stream_analyze_data(self, request: AnalysisRequest) -> Iterator[str]:
+        """
+        데이터 분석 스트리밍 - 생성되는 분석 텍스트를 조각 단위로 반환
+        """
+        try:
+            yield from self.repository.stream_prompt(self._build_analysis_llm_request(request))
+            
+        except Exception as e:
+            logger.error(f"데이터 분석 스트리밍 중 오류: {sanitize_error_message(str(e))}")
+            raise
+    
+    def _build_analysis_llm_request(self, request: AnalysisRequest) -> LLMRequest:
+        """데이터 분석용 LLM 요청 구성"""
+        # 설정 관리자에서 data_analysis 설정 가져오기
+        config = self.config_manager.get_config('data_analysis')
+        
+        # ContextBlock을 완전한 컨텍스트 단위로 처리
+        context_json = self._prepare_analysis_context_json(request.context_blocks, config.max_input_tokens)
+        
+        # 프롬프트 준비
+        system_prompt = prompt_manager.get_prompt(
+            category='data_analysis',
+            template_name='system_prompt',
+            fallback_prompt="데이터를 분석하고 인사이트를 제공하는 전문가입니다."
+        )
+        
+        # ContextBlock 완전한 단위로 전달 (설계 원칙 준수)
+        user_prompt = prompt_manager.get_prompt(
+            category='data_analysis',
+            template_name='user_prompt',
+            context_json=context_json,  # 단일 변수로 통합
+            question=request.user_question,
+            fallback_prompt=lambda: FallbackPrompts.analysis(request.user_question, context_json)
+        )
+        
+        return LLMRequest(
+            model=config.model_id,
+            system=system_prompt,
+            messages=[{"role": "user", "content": user_prompt}],
+            max_tokens=config.max_tokens,
+            temperature=config.temperature
+        )
+    
     def generate_guide(self, request: GuideRequest) -> str:
         """
         가이드 생성
         """
         try:
-            user_prompt = prompt_manager.get_prompt(
-                category='guides',
-                template_name='usage_guide',
-                question=request.question,
-                context=request.context or "",
-                fallback_prompt=FallbackPrompts.guide(request.question, request.context or "")
-            )
-            
-            # 설정 관리자에서 guide_generation 설정 가져오기
-            config = self.config_manager.get_config('guide_generation')
-            
-            llm_request = LLMRequest(
-                model=config.model_id,
-                messages=[{"role": "user", "content": user_prompt}],
-                max_tokens=config.max_tokens,
-                temperature=config.temperature
-            )
-            
-            response = self.repository.execute_prompt(llm_request)
+            response = self._cached_execute(self._build_guide_llm_request(request))
             return response.content
             
         except Exception as e:
             logger.error(f"가이드 생성 중 오류: {sanitize_error_message(str(e))}")
             raise
     
+    def stream_generate_guide(self, request: GuideRequest) -> Iterator[str]:
+        """
+        가이드 생성 스트리밍 - 생성되는 안내 텍스트를 조각 단위로 반환
+        """
+        try:
+            yield from self.repository.stream_prompt(self._build_guide_llm_request(request))
+            
+        except Exception as e:
+            logger.error(f"가이드 생성 스트리밍 중 오류: {sanitize_error_message(str(e))}")
+            raise
+    
+    def _build_guide_llm_request(self, request: GuideRequest) -> LLMRequest:
+        """가이드 생성용 LLM 요청 구성"""
+        user_prompt = prompt_manager.get_prompt(
+            category='guides',
+            template_name='usage_guide',
+            question=request.question,
+            context=request.context or "",
+            fallback_prompt=lambda: FallbackPrompts.guide(request.question, request.context or "")
+        )
+        
+        # 설정 관리자에서 guide_generation 설정 가져오기
+        config = self.config_manager.get_config('guide_generation')
+        
+        return LLMRequest(
+            model=config.model_id,
+            messages=[{"role": "user", "content": user_prompt}],
+            max_tokens=config.max_tokens,
+            temperature=config.temperature
+        )
+    
     def generate_out_of_scope(self, request: OutOfScopeRequest) -> str:
         """
         범위 외 응답 생성
@@ -268,7 +435,7 @@ class LLMService:
                 template_name='out_of_scope',
                 question=request.question,
                 detected_intent=request.detected_intent or "",
-                fallback_prompt=FallbackPrompts.out_of_scope(request.question)
+                fallback_prompt=lambda: FallbackPrompts.out_of_scope(request.question)
             )
             
             # 설정 관리자에서 out_of_scope 설정 가져오기
@@ -281,7 +448,7 @@ class LLMService:
                 temperature=config.temperature
             )
             
-            response = self.repository.execute_prompt(llm_request)
+            response = self._cached_execute(llm_request)
             return response.content
             
         except Exception as e:
@@ -303,12 +470,9 @@ class LLMService:
             LLM 응답 텍스트 또는 None
         """
         try:
-            # 설정 관리자에서 기본 설정 가져오기
-            config = self.config_manager.get_config('sql_generation')  # 기본 설정 사용
-            
             # LLM 요청
             llm_request = LLMRequest(
-                model=config.model_id,
+                model=self.get_direct_model_id(),
                 system=system_prompt,
                 messages=[{"role": "user", "content": user_prompt}],
                 max_tokens=max_tokens,
@@ -322,6 +486,55 @@ class LLMService:
             logger.error(f"직접 LLM 호출 중 오류: {sanitize_error_message(str(e))}")
             return None
     
+    def get_direct_model_id(self) -> str:
+        """call_llm_direct가 사용하는 모델 ID (기본 설정 사용, 호출자 캐시 키용)"""
+        return self.config_manager.get_config('sql_generation').model_id
+    
+    def _cached_execute(self, llm_request: LLMRequest) -> LLMResponse:
+        """
+        응답 캐시를 거친 LLM 호출
+        
+        동일한 모델/프롬프트/온도의 요청은 TTL 동안 이전 응답을 재사용
+        (온도가 높은 요청은 캐시하지 않음)
+        """
+        if llm_request.temperature > _RESPONSE_CACHE_MAX_TEMPERATURE:
+            return self.repository.execute_prompt(llm_request)
+        
+        cache_key = self._response_cache_key(llm_request)
+        with self._resp_cache_lock:
+            cached = self._resp_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("LLM 응답 캐시 적중")
+            return cached
+        
+        response = self.repository.execute_prompt(llm_request)
+        with self._resp_cache_lock:
+            self._resp_cache[cache_key] = response
+        return response
+    
+    @staticmethod
+    def _response_cache_key(llm_request: LLMRequest) -> str:
+        """모델/system/메시지/온도/최대 토큰을 해시한 응답 캐시 키"""
+        payload = orjson.dumps(
+            [
+                llm_request.model,
+                llm_request.system_blocks or llm_request.system,
+                llm_request.messages,
+                llm_request.temperature,
+                llm_request.max_tokens
+            ],
+            option=orjson.OPT_SORT_KEYS
+        )
+        return xxhash.xxh3_128_hexdigest(payload)
+    
+    @staticmethod
+    def _build_cached_system_blocks(system_prompt: str) -> Optional[List[Dict[str, Any]]]:
+        """정적 system 프롬프트(스키마/예시/지침) 전체에 cache_control을 지정한 블록 생성"""
+        if not system_prompt:
+            return None
+        
+        return [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+    
     def _prepare_sql_template_variables(self, request: 'SQLGenerationRequest', context_blocks_formatted: str) -> Dict[str, str]:
         """
         SQL 생성 템플릿을 위한 변수 준비 (JSON 데이터 직접 문자열 변환)
@@ -335,12 +548,8 @@ class LLMService:
             }
             
             # MetaSync JSON 데이터를 직접 문자열로 변환
-            cache_data = self.metasync_repository.get_cache_data()
-            
-            # JSON을 그대로 문자열로 변환
-            metasync_info = json.dumps(cache_data, ensure_ascii=False, indent=2)
+            metasync_info = self._render_metasync_info(self.metasync_repository.get_cache_data())
             template_vars['metasync_info'] = metasync_info
-            logger.info(f"MetaSync 캐시 데이터를 JSON 문자열로 직접 전달 ({len(metasync_info)} chars)")
             
             return template_vars
             
@@ -353,36 +562,85 @@ class LLMService:
                 'metasync_info': '{"generated_at": "", "generation_method": "fallback", "schema": {}, "examples": [], "events_tables": {}, "schema_insights": {}}'
             }
     
-    def _prepare_analysis_context_json(self, context_blocks: List[ContextBlock]) -> str:
+    def _render_metasync_info(self, cache_data: Dict[str, Any]) -> str:
+        """
+        MetaSync 캐시 데이터를 프롬프트용 JSON 문자열로 변환 (메모이즈)
+        
+        MetaSyncRepository는 갱신 주기 동안 같은 딕셔너리 객체를 반환하므로,
+        객체가 동일하면 이전 직렬화 결과를 재사용 (프롬프트 캐시 접두부도 동일하게 유지)
+        """
+        rendered = self._metasync_render
+        if rendered is not None and rendered[0] is cache_data:
+            return rendered[1]
+        
+        # JSON을 그대로 문자열로 변환 (LLM에는 들여쓰기가 불필요하므로 압축 형식)
+        metasync_info = orjson.dumps(cache_data, default=str).decode()
+        self._metasync_render = (cache_data, metasync_info)
+        logger.info(f"MetaSync 캐시 데이터를 JSON 문자열로 변환 ({len(metasync_info)} chars)")
+        return metasync_info
+    
+    def _prepare_analysis_context_json(self, context_blocks: List[ContextBlock], max_tokens: Optional[int] = None) -> str:
         """
         데이터 분석을 위한 context_json 준비 - ContextBlock 설계 의도 완전 준수
         ContextBlock 모델의 유틸리티 함수 적극 활용
+        
+        max_tokens가 주어지면 추정 토큰 수가 예산 안에 들도록 블록별 결과 행을 비례 축소
         """
         try:
+            # 동일한 블록 구성이면 이전 직렬화 결과 재사용
+            cache_key = (_blocks_key(context_blocks), max_tokens)
+            cached = _ANALYSIS_CONTEXT_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+            
             # ContextBlock 모델의 전용 유틸리티 함수 활용
-            from core.models.context import create_analysis_context
             context_data = create_analysis_context(context_blocks)
             
-            # List[ContextBlock]를 직렬화 가능한 형태로 변환
-            from core.models.context import context_blocks_to_complete_format
-            context_data["context_blocks"] = context_blocks_to_complete_format(context_data["context_blocks"])
-            
             # 로깅
             row_count = context_data["meta"]["total_row_count"]  
             if row_count > 0:
                 logger.info(f"📊 분석용 데이터 추출 완료: {row_count}개 행")
             
-            return json.dumps(context_data, ensure_ascii=False, indent=2)
+            # ContextBlock(dataclass)을 orjson이 직접 직렬화 (to_dict와 같은 키/형식, 중간 딕셔너리 생략)
+            context_json = self._dump_analysis_context(context_data)
+            
+            # 토큰 예산 초과 시 결과 행을 비례 축소 (원본 블록은 변경하지 않음)
+            if max_tokens and _estimate_tokens(context_json) > max_tokens:
+                ratio = max_tokens / _estimate_tokens(context_json)
+                # 축소할 블록만 딕셔너리 형태로 변환
+                context_data["context_blocks"] = context_blocks_to_complete_format(context_data["context_blocks"])
+                for block_dict in context_data["context_blocks"]:
+                    execution_result = block_dict.get("execution_result")
+                    rows = (execution_result or {}).get("data")
+                    if isinstance(rows, list) and len(rows) > 1:
+                        keep = max(1, int(len(rows) * ratio))
+                        block_dict["execution_result"] = {**execution_result, "data": rows[:keep]}
+                context_json = self._dump_analysis_context(context_data)
+                logger.info(f"✂️ 분석 컨텍스트 축소: 토큰 예산 {max_tokens} (비율 {ratio:.2f})")
+            
+            _ANALYSIS_CONTEXT_CACHE.put(cache_key, context_json)
+            return context_json
             
         except Exception as e:
             logger.warning(f"분석 컨텍스트 JSON 준비 중 오류: {str(e)}")
             return '{"context_blocks": [], "meta": {"total_row_count": 0, "blocks_count": 0}, "limits": {"max_rows": 100}}'
     
-    def is_available(self) -> bool:
+    @staticmethod
+    def _dump_analysis_context(context_data: Dict[str, Any]) -> str:
+        """분석 컨텍스트를 압축 JSON 문자열로 직렬화 (LLM 입력에는 들여쓰기 불필요)"""
+        return orjson.dumps(context_data, option=orjson.OPT_NON_STR_KEYS, default=str).decode()
+    
+    def is_available(self, force: bool = False) -> bool:
+        """
+        서비스 가용성 확인 (Repository의 TTL 캐시 공유)
+        """
+        return self.repository.is_available(force=force)
+    
+    def is_degraded(self) -> bool:
         """
-        서비스 가용성 확인
+        LLM 장애 차단 상태 확인
         """
-        return self.repository.is_available()
+        return self.repository.is_degraded()
     
     def get_model_info(self) -> Dict[str, Any]:
         """
@@ -390,43 +648,56 @@ class LLMService:
         """
         return self.repository.get_model_info()
     
-    def _format_context_blocks_for_prompt(self, context_blocks: List[ContextBlock]) -> str:
+    def _format_context_blocks_for_prompt(self, context_blocks: List[ContextBlock], max_tokens: Optional[int] = None) -> str:
         """
         ContextBlock 리스트를 프롬프트용 문자열로 변환 (완전한 컨텍스트 포함)
         대화 + 쿼리 + 실행결과 메타정보까지 포함하는 완전한 컨텍스트
+        
+        max_tokens가 주어지면 추정 토큰 수가 예산 안에 들 때까지 오래된 블록부터 제외
         """
         if not context_blocks:
-            return "[이전 대화 없음]"
+            return _EMPTY_CTX_MSG
         
-        # ContextBlock 모델의 유틸리티 함수 활용
-        from core.models.context import context_blocks_to_llm_format
         recent_blocks = context_blocks[-5:]  # 최근 5개만
+        
+        # 전체 렌더링 결과는 예산과 무관하게 블록 구성으로만 캐시하여
+        # 한 턴의 분류 → SQL 생성처럼 예산이 다른 호출 사이에서도 재사용
+        blocks_key = _blocks_key(recent_blocks)
+        formatted = _PROMPT_CONTEXT_CACHE.get((blocks_key, None))
+        if formatted is None:
+            formatted = self._render_context_blocks(recent_blocks)
+            _PROMPT_CONTEXT_CACHE.put((blocks_key, None), formatted)
+        
+        if not max_tokens or _estimate_tokens(formatted) <= max_tokens:
+            return formatted
+        
+        # 예산 초과 시에만 예산별 축소 결과를 별도 캐시
+        cache_key = (blocks_key, max_tokens)
+        cached = _PROMPT_CONTEXT_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        while len(recent_blocks) > 1 and _estimate_tokens(formatted) > max_tokens:
+            recent_blocks = recent_blocks[1:]
+            formatted = self._render_context_blocks(recent_blocks)
+        
+        _PROMPT_CONTEXT_CACHE.put(cache_key, formatted)
+        return formatted
+    
+    @staticmethod
+    def _render_context_blocks(recent_blocks: List[ContextBlock]) -> str:
+        """ContextBlock 리스트를 번호가 매겨진 대화 문자열로 렌더링"""
+        # ContextBlock 모델의 유틸리티 함수 활용
         llm_messages = context_blocks_to_llm_format(recent_blocks)
+        if not llm_messages:
+            return _EMPTY_CTX_MSG
         
         formatted_parts = []
         conversation_idx = 1
-        
         for msg in llm_messages:
-            role = "사용자" if msg["role"] == "user" else "AI"
-            base_msg = f"[{conversation_idx}] {role}: {msg['content']}"
-            
-            # AI 응답의 경우 실행 통계 정보 추가
+            formatted_parts.append(_format_context_message(conversation_idx, msg))
+            # AI 응답까지를 한 번호로 묶음
             if msg["role"] == "assistant" and "metadata" in msg:
-                execution_info = []
-                
-                # 생성된 쿼리 정보
-                if msg["metadata"].get("generated_query"):
-                    execution_info.append(f"SQL: {msg['metadata']['generated_query']}")
-                
-                # 실행 결과 행 수 정보  
-                if msg.get("query_row_count", 0) > 0:
-                    execution_info.append(f"결과: {msg['query_row_count']}개 행")
-                
-                if execution_info:
-                    base_msg += f" ({', '.join(execution_info)})"
-                
                 conversation_idx += 1
-            
-            formatted_parts.append(base_msg)
         
-        return "\n".join(formatted_parts) if formatted_parts else "[이전 대화 없음]"
\ No newline at end of file
+        return "\n".join(formatted_parts)
\ No newline at end of file
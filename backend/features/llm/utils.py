@@ -4,12 +4,19 @@ LLM 처리를 위한 유틸리티 함수들
 """
 
 import re
-import json
+import orjson
 from typing import Dict, Any, List, Optional
 from utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+# 모듈 로드 시 한 번만 컴파일하는 정규식
+_CODE_BLOCK_RE = re.compile(r'```(?:sql)?\s*\n?(.*?)\n?```', re.DOTALL)
+# 민감 정보 마스킹: API 키/토큰 값 (키 종류는 그룹 1로 구분)
+_SECRET_RE = re.compile(r'(api[_-]?key|token)["\']?\s*:\s*["\'][^"\']+["\']', re.IGNORECASE)
+# 질문 추출: 따옴표로 둘러싸인 질문 | 번호가 붙은 질문 | 대문자/한글로 시작하는 질문
+_QUESTIONS_RE = re.compile(r'"([^"]+\?)"|(\d+\.\s+[^?\n]+\?)|([A-Z가-힣][^?\n]*\?)')
+
 
 def clean_sql_response(response: str) -> str:
     """
@@ -19,7 +26,7 @@ def clean_sql_response(response: str) -> str:
         return ""
     
     # 코드 블록 제거 (```sql ... ```)
-    response = re.sub(r'```(?:sql)?\s*\n?(.*?)\n?```', r'\1', response, flags=re.DOTALL)
+    response = _CODE_BLOCK_RE.sub(r'\1', response)
     
     # 일반적인 불필요한 텍스트 제거
     response = response.replace('여기는 요청하신 SQL 쿼리입니다:', '')
@@ -104,39 +111,73 @@ def extract_json_from_response(response: str) -> Optional[Dict[str, Any]]:
     LLM 응답에서 JSON 추출
     """
     try:
-        # 직접 JSON 파싱 시도
-        return json.loads(response)
-    except json.JSONDecodeError:
+        # 직접 JSON 파싱 시도 (orjson 고속 경로)
+        return orjson.loads(response)
+    except orjson.JSONDecodeError:
         pass
     
-    # JSON 패턴 찾기
-    json_patterns = [
-        r'\{.*\}',
-        r'\[.*\]'
-    ]
-    
-    for pattern in json_patterns:
-        matches = re.findall(pattern, response, re.DOTALL)
-        for match in matches:
+    # 괄호 균형이 맞는 JSON 후보를 찾아 객체 → 배열 순으로 시도
+    candidates = list(_iter_json_candidates(response))
+    for opener in ('{', '['):
+        for candidate in candidates:
+            if candidate[0] != opener:
+                continue
             try:
-                return json.loads(match)
-            except json.JSONDecodeError:
+                return orjson.loads(candidate)
+            except orjson.JSONDecodeError:
                 continue
     
     return None
 
 
+def _iter_json_candidates(text: str):
+    """
+    텍스트를 한 번 훑어 괄호 균형이 맞는 최상위 {...}/[...] 구간을 순서대로 반환
+    
+    문자열 리터럴 안의 괄호와 이스케이프는 무시하고, 짝이 맞지 않으면 해당 후보를 버림
+    """
+    closers = {'{': '}', '[': ']'}
+    stack: List[str] = []
+    start = 0
+    in_string = False
+    escaped = False
+    
+    for i, ch in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+            continue
+        
+        if ch in closers:
+            if not stack:
+                start = i
+            stack.append(closers[ch])
+        elif not stack:
+            continue
+        elif ch == '"':
+            in_string = True
+        elif ch == '}' or ch == ']':
+            if ch != stack.pop():
+                stack.clear()
+            elif not stack:
+                yield text[start:i + 1]
+
+
 def sanitize_error_message(error_msg: str) -> str:
     """
     에러 메시지에서 민감한 정보 제거
     """
-    # API 키 패턴 제거
-    sanitized = re.sub(r'api[_-]?key["\']?\s*:\s*["\'][^"\']+["\']', 'api_key: [REDACTED]', error_msg, flags=re.IGNORECASE)
-    
-    # 토큰 패턴 제거
-    sanitized = re.sub(r'token["\']?\s*:\s*["\'][^"\']+["\']', 'token: [REDACTED]', sanitized, flags=re.IGNORECASE)
-    
-    return sanitized
+    # API 키/토큰 패턴을 한 번의 스캔으로 제거
+    return _SECRET_RE.sub(_redact_secret, error_msg)
+
+
+def _redact_secret(match: re.Match) -> str:
+    """마스킹 치환 문자열 (토큰이면 token, 그 외에는 api_key)"""
+    return 'token: [REDACTED]' if match.group(1).lower() == 'token' else 'api_key: [REDACTED]'
 
 
 def extract_latest_result_rows(blocks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -163,17 +204,28 @@ def pack_rows_as_json(rows: List[Dict[str, Any]], max_rows: int = 200, max_chars
         return "[]"
     
     n = min(len(rows), max_rows)
-    while n >= 1:
-        chunk = rows[:n]
-        s = json.dumps(chunk, ensure_ascii=False, separators=(',', ':'))
+    s = orjson.dumps(rows[:n], default=str).decode()
+    if len(s) <= max_chars:
+        return s
+    
+    # 크기 초과 시 앞쪽 표본으로 행당 평균 크기를 추정해 첫 탐색 지점으로 사용
+    sample = rows[:min(8, n)]
+    avg_row_chars = max(1, len(orjson.dumps(sample, default=str).decode()) // len(sample))
+    
+    # 제한 안에 드는 최대 행 수를 이진 탐색 (best: 제한을 만족한 최대 직렬화 결과)
+    best = "[]"
+    lo, hi = 0, n - 1
+    mid = min(hi, max(1, max_chars // avg_row_chars))
+    while lo < hi:
+        s = orjson.dumps(rows[:mid], default=str).decode()
         if len(s) <= max_chars:
-            return s
-        # 크기 초과 시 행 수를 줄여 재시도(70% 비율로 감소)
-        new_n = int(n * 0.7)
-        n = new_n if new_n < n else n - 1
+            lo, best = mid, s
+        else:
+            hi = mid - 1
+        mid = (lo + hi + 1) // 2
     
     # 최소 1행도 초과하면 빈 배열 반환
-    return "[]"
+    return best
 
 
 def format_analysis_context(context_messages: List[Dict[str, Any]], limit: int = 5) -> str:
@@ -219,23 +271,25 @@ def format_analysis_context(context_messages: List[Dict[str, Any]], limit: int =
 def extract_questions_from_text(text: str) -> List[str]:
     """
     텍스트에서 질문들을 추출하는 헬퍼 함수
+    
+    세 패턴(따옴표/번호/대문자·한글 시작)을 하나의 정규식으로 한 번만 스캔하므로:
+    - 결과는 패턴 순서가 아니라 본문에 나온 순서를 따름
+    - 겹치는 구간은 먼저 일치한 패턴으로 한 번만 추출됨
+      (예: 'He asked "What is X?"'는 'He asked "What is X?' 하나만 추출되고,
+      기존처럼 따옴표 안의 'What is X?'가 별도 항목으로 추가되지 않음)
+    - 중복 제거 후 최대 10개까지 반환
     """
-    questions = []
-    
-    # 다양한 패턴으로 질문 추출
-    patterns = [
-        r'"([^"]+\?)"',  # 따옴표로 둘러싸인 질문
-        r'(\d+\.\s+[^?\n]+\?)',  # 번호가 붙은 질문
-        r'([A-Z가-힣][^?\n]*\?)',  # 대문자/한글로 시작하는 질문
-    ]
-    
-    for pattern in patterns:
-        matches = re.findall(pattern, text)
-        for match in matches:
-            question = match.strip()
-            # 중복 제거 및 최소 길이 검증
-            if question and len(question) > 5 and question not in questions:
-                questions.append(question)
-    
-    # 최대 10개 질문만 반환
-    return questions[:10]
\ No newline at end of file
+    # 순서를 유지하는 중복 제거용 딕셔너리
+    questions: Dict[str, None] = {}
+    
+    # 세 가지 패턴을 한 번의 스캔으로 추출 (본문 순서대로)
+    for match in _QUESTIONS_RE.finditer(text):
+        question = next(group for group in match.groups() if group is not None).strip()
+        # 최소 길이 검증
+        if len(question) > 5:
+            questions.setdefault(question)
+            # 최대 10개 질문만 반환
+            if len(questions) == 10:
+                break
+    
+    return list(questions)
\ No newline at end of file
@@ -3,12 +3,12 @@ MetaSync 도메인 모델 정의
 메타데이터 캐시 시스템의 데이터 구조와 비즈니스 규칙
 """
 
-from dataclasses import dataclass
-from typing import Dict, Any, Optional, List
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, List, Iterator, Tuple
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class SchemaInfo:
     """
     BigQuery 테이블 스키마 정보
@@ -41,7 +41,7 @@ class SchemaInfo:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class EventsTableInfo:
     """
     Events 테이블 추상화 정보 (토큰 절약용)
@@ -71,7 +71,7 @@ class EventsTableInfo:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class FewShotExample:
     """
     LLM Few-Shot 학습용 예시
@@ -98,7 +98,7 @@ class FewShotExample:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class MetadataCache:
     """
     MetaSync 메타데이터 캐시 전체 구조
@@ -110,6 +110,8 @@ class MetadataCache:
     examples: List[Dict[str, Any]]
     events_tables: Dict[str, Any]
     schema_insights: Optional[Dict[str, Any]] = None
+    # generated_at 파싱 결과 캐시: (원본 문자열, 파싱된 시각 또는 형식 오류 시 None)
+    _generated_dt: Optional[Tuple[str, Optional[datetime]]] = field(default=None, init=False, repr=False, compare=False)
     
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리로 변환 (JSON 직렬화용)"""
@@ -151,9 +153,9 @@ class MetadataCache:
             'description': table_schema.get('description')
         })
     
-    def get_few_shot_examples(self) -> List[FewShotExample]:
-        """Few-Shot 예시 목록 반환"""
-        return [FewShotExample.from_dict(example) for example in self.examples]
+    def get_few_shot_examples(self) -> Iterator[FewShotExample]:
+        """Few-Shot 예시를 순회 시점에 하나씩 생성 (앞쪽 일부만 쓰는 경우 불필요한 할당 방지)"""
+        return (FewShotExample.from_dict(example) for example in self.examples)
     
     def get_events_table_info(self) -> Optional[EventsTableInfo]:
         """Events 테이블 추상화 정보 반환"""
@@ -163,13 +165,26 @@ class MetadataCache:
     
     def is_cache_valid(self, max_age_hours: int = 24) -> bool:
         """캐시 유효성 검사"""
+        generated_time = self._parse_generated_at()
+        if generated_time is None:
+            return False
+        
+        current_time = datetime.now(generated_time.tzinfo)
+        age_hours = (current_time - generated_time).total_seconds() / 3600
+        return age_hours <= max_age_hours
+    
+    def _parse_generated_at(self) -> Optional[datetime]:
+        """generated_at을 datetime으로 변환 (값이 바뀌지 않았으면 이전 파싱 결과 재사용)"""
+        cached = self._generated_dt
+        if cached is not None and cached[0] == self.generated_at:
+            return cached[1]
+        
         try:
-            generated_time = datetime.fromisoformat(self.generated_at.replace('Z', '+00:00'))
-            current_time = datetime.now(generated_time.tzinfo)
-            age_hours = (current_time - generated_time).total_seconds() / 3600
-            return age_hours <= max_age_hours
+            generated_time = datetime.fromisoformat(self.generated_at)
         except (ValueError, AttributeError):
-            return False
+            generated_time = None
+        self._generated_dt = (self.generated_at, generated_time)
+        return generated_time
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """캐시 통계 정보 반환"""
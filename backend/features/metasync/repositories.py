@@ -3,13 +3,18 @@ MetaSync Repository - GCS 및 BigQuery 데이터 접근 계층
 기존 MetaSyncCacheLoader의 모든 기능을 Repository 패턴으로 구현
 """
 
-import json
-from typing import Dict, Any, List, Optional
+import gzip
+import logging
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import Dict, Any, List, Optional, Tuple
+import orjson
 from datetime import datetime, timezone, timedelta
 from google.cloud import bigquery, storage
-from google.cloud.exceptions import NotFound
+from google.cloud.exceptions import NotFound, NotModified
 
-from core.repositories.gcs_base import GCSRepository
+from core.repositories.gcs_base import GCSClient, GCSRepository, dump_json_bytes
 from features.metasync.models import (
     MetadataCache, SchemaInfo, EventsTableInfo, 
     CacheStatus, CacheUpdateRequest
@@ -18,6 +23,49 @@ from utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+# 샘플 데이터 조회 쿼리의 최대 과금 바이트 (대형 테이블에서 예기치 않은 전체 스캔 방지)
+_SAMPLE_MAX_BYTES_BILLED = 10 * 1024 ** 3
+# 테이블 목록 조회(INFORMATION_SCHEMA) 쿼리의 최대 과금 바이트 (메타데이터 쿼리는 최소 10MB 과금)
+_TABLES_LIST_MAX_BYTES_BILLED = 100 * 1024 ** 2
+
+# 캐시 만료 기준
+_CACHE_MAX_AGE = timedelta(hours=24)
+
+# 캐시 사용 가능 여부 확인 결과 재사용 시간 (초)
+_AVAILABILITY_TTL = 15.0
+
+# 스냅샷 목록 재사용 시간 (초) - 다른 인스턴스가 만든 스냅샷도 이 시간 안에 반영
+_SNAPSHOT_LIST_TTL = 60.0
+# 한 번에 조회하는 최대 스냅샷 수 (스냅샷이 쌓여도 목록 조회 비용을 일정하게 유지)
+_SNAPSHOT_LIST_MAX = 100
+
+# 프로세스 단위 BigQuery 클라이언트 (프로젝트/위치별, GCS와 HTTP 연결 풀 공유)
+_bigquery_clients: Dict[Tuple[str, str], bigquery.Client] = {}
+_bigquery_clients_lock = threading.Lock()
+
+
+def _get_bigquery_client(project_id: str, location: str) -> bigquery.Client:
+    """BigQuery 클라이언트 재사용 (요청 제출은 스레드 안전)"""
+    key = (project_id, location)
+    client = _bigquery_clients.get(key)
+    if client is None:
+        http = GCSClient.get_http_session()
+        with _bigquery_clients_lock:
+            client = _bigquery_clients.get(key)
+            if client is None:
+                client = bigquery.Client(project=project_id, location=location, _http=http)
+                _bigquery_clients[key] = client
+    return client
+
+
+@dataclass(frozen=True, slots=True)
+class _CacheState:
+    """메모리 캐시 스냅샷 (불변 - 갱신 시 새 객체로 교체)"""
+    data: Dict[str, Any]
+    raw: bytes
+    generation: Optional[int] = None
+    loaded_at: Optional[datetime] = None
+
 
 class MetaSyncRepository(GCSRepository):
     """
@@ -40,16 +88,30 @@ class MetaSyncRepository(GCSRepository):
         super().__init__(bucket_name, project_id)
         
         self.bigquery_location = bigquery_location
-        self.bigquery_client = bigquery.Client(project=self.project_id, 
-                                             location=self.bigquery_location)
+        self.bigquery_client = _get_bigquery_client(self.project_id, self.bigquery_location)
         
-        # 메모리 캐시 관리
-        self._cache_data: Optional[Dict[str, Any]] = None
-        self._last_loaded: Optional[datetime] = None
-        self.cache_refresh_interval = timedelta(hours=1)
+        # 메모리 캐시 스냅샷 (파싱된 딕셔너리, 원본 JSON 바이트, GCS generation, 확인 시각)
+        # 항상 새 객체로 통째로 교체하므로 읽는 쪽은 잠금 없이 일관된 상태를 봄
+        self._state: Optional[_CacheState] = None
+        # gzip 압축본 (HTTP 응답용, (원본 바이트, 압축 바이트) - 원본이 바뀔 때까지 한 번만 압축)
+        self._cache_gzip: Optional[Tuple[bytes, bytes]] = None
+        # GCS 로드/교체 직렬화 (한 스레드만 GCS를 확인)
+        self._lock = threading.Lock()
+        # 마지막으로 GCS 변경 여부를 확인한 뒤 다시 확인하기까지의 간격 (변경이 없으면 본문을 다시 받지 않음)
+        self.cache_refresh_interval = timedelta(seconds=60)
         
         # 캐시 파일 경로
         self.cache_file_path = "metadata_cache.json"
+        # 메타데이터 요약 파일 경로 (save_cache에서 함께 저장)
+        self.cache_meta_file_path = "metadata_cache.json.meta.json"
+        # LLM 응답 캐시 경로 접두어 (프롬프트 해시별 파일)
+        self.llm_cache_prefix = "llmcache/"
+        # 메타데이터 요약 캐시 ((계산에 쓴 캐시 데이터 객체, 요약))
+        self._metadata_view: Optional[Tuple[Dict[str, Any], Dict[str, Any]]] = None
+        # 캐시 사용 가능 여부 확인 결과 ((확인 시각, 결과) - save_cache에서 무효화)
+        self._availability_cache: Optional[Tuple[float, bool]] = None
+        # 스냅샷 목록 캐시 ((조회 시각, 목록) - 이 프로세스가 스냅샷을 만들면 무효화)
+        self._snapshots_cache: Optional[Tuple[float, List[str]]] = None
     
     # ====== 기존 MetaSyncCacheLoader 호환 인터페이스 ======
     
@@ -65,51 +127,88 @@ class MetaSyncRepository(GCSRepository):
         캐시 데이터를 메모리 캐싱과 함께 로드
         기존 MetaSyncCacheLoader의 _get_cache_data() 메서드와 동일한 동작
         """
-        now = datetime.now()
+        return self._load_state().data
+    
+    def _is_fresh(self, state: Optional[_CacheState]) -> bool:
+        """메모리 캐시가 재확인 간격 내에 있는지 확인"""
+        return (state is not None and state.loaded_at is not None and
+                (datetime.now() - state.loaded_at) <= self.cache_refresh_interval)
+    
+    def _load_state(self) -> _CacheState:
+        """
+        메모리 캐시 스냅샷 반환 (만료 시 GCS 재확인)
+        한 스레드만 GCS를 확인하고, 나머지는 기존 스냅샷이 있으면 그대로 사용하며 없으면 대기
+        """
+        state = self._state
+        if self._is_fresh(state):
+            return state
         
-        # 메모리 캐시 확인
-        if (self._cache_data is None or 
-            self._last_loaded is None or 
-            (now - self._last_loaded) > self.cache_refresh_interval):
+        if not self._lock.acquire(blocking=state is None):
+            return state
+        try:
+            # 대기 중 다른 스레드가 이미 로드했으면 그 결과 사용
+            state = self._state
+            if self._is_fresh(state):
+                return state
             
+            now = datetime.now()
             try:
-                # GCS에서 캐시 로드 (JSON 문자열을 딕셔너리로 파싱)
-                cache_data = self.read_json(self.cache_file_path)
+                # generation이 바뀐 경우에만 내려받아 원본 바이트와 파싱 결과를 함께 캐시
+                known_generation = state.generation if state is not None else None
+                cache_bytes, generation = self.read_bytes(
+                    self.cache_file_path, if_generation_not_match=known_generation
+                )
+                cache_data = orjson.loads(cache_bytes) if cache_bytes else None
                 
                 if not cache_data:
                     logger.warning("Cache file does not exist or is empty in GCS")
-                    cache_data = self._get_empty_cache_structure()
-                
-                self._cache_data = cache_data
-                self._last_loaded = now
+                    state = self._empty_state(now)
+                else:
+                    state = _CacheState(cache_data, cache_bytes, generation, now)
                 logger.info("Cache loaded from GCS")
                 
+            except NotModified:
+                # 변경 없음 - 기존 메모리 캐시 유지 (같은 객체를 반환해야 하위 직렬화 캐시도 유지됨)
+                state = replace(state, loaded_at=now)
+                
             except Exception as e:
                 logger.error(f"Failed to load cache from GCS: {e}")
-                self._cache_data = self._get_empty_cache_structure()
+                state = self._empty_state(None)
+            
+            self._state = state
+            return state
+        finally:
+            self._lock.release()
+    
+    def _empty_state(self, loaded_at: Optional[datetime]) -> _CacheState:
+        """빈 캐시 구조의 스냅샷 생성"""
+        return _CacheState(self._get_empty_cache_structure(), _EMPTY_CACHE_JSON, None, loaded_at)
+    
+    def get_cache_data_raw(self) -> bytes:
+        """
+        캐시 데이터를 원본 JSON 바이트로 반환 (순서 보장, 메모리 캐시 공유)
+        """
+        return self._load_state().raw
+    
+    def get_cache_data_gzip(self) -> bytes:
+        """
+        캐시 원본 JSON 바이트의 gzip 압축본 반환 (캐시가 바뀔 때만 다시 압축)
+        """
+        cache_bytes = self._load_state().raw
+        cached = self._cache_gzip
+        if cached is not None and cached[0] is cache_bytes:
+            return cached[1]
         
-        return self._cache_data or self._get_empty_cache_structure()
+        compressed = gzip.compress(cache_bytes, compresslevel=6, mtime=0)
+        self._cache_gzip = (cache_bytes, compressed)
+        return compressed
     
-    def get_cache_data_raw(self) -> str:
+    def get_cache_etag(self) -> Optional[str]:
         """
-        캐시 데이터를 원본 JSON 문자열로 반환 (순서 보장)
+        메모리 캐시의 GCS generation을 ETag 값으로 반환 (GCS 캐시가 없으면 None)
         """
-        try:
-            # GCS에서 원본 JSON 문자열 직접 읽기
-            cache_text = self.read_text(self.cache_file_path)
-            
-            if not cache_text or cache_text == "{}":
-                logger.warning("Cache file does not exist or is empty in GCS")
-                import json
-                return json.dumps(self._get_empty_cache_structure(), ensure_ascii=False, indent=2)
-            
-            logger.info("Raw cache loaded from GCS")
-            return cache_text
-            
-        except Exception as e:
-            logger.error(f"Failed to load raw cache from GCS: {e}")
-            import json
-            return json.dumps(self._get_empty_cache_structure(), ensure_ascii=False, indent=2)
+        generation = self._load_state().generation
+        return str(generation) if generation is not None else None
     
     def _ensure_correct_order(self, cache_data: Dict[str, Any]) -> Dict[str, Any]:
         """원본 MetaSync와 동일한 순서로 딕셔너리 재정렬"""
@@ -122,10 +221,11 @@ class MetaSyncRepository(GCSRepository):
             "schema_insights": cache_data.get("schema_insights", {})
         }
     
-    def _get_empty_cache_structure(self) -> Dict[str, Any]:
-        """빈 캐시 구조 반환"""
+    @staticmethod
+    def _get_empty_cache_structure() -> Dict[str, Any]:
+        """빈 캐시 구조 반환 (생성된 적 없는 캐시이므로 generated_at은 빈 값)"""
         return {
-            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "generated_at": "",
             "generation_method": "unknown",
             "schema": {}, 
             "examples": [], 
@@ -140,7 +240,8 @@ class MetaSyncRepository(GCSRepository):
             schema = cache_data.get('schema', {})
             
             if schema:
-                logger.info(f"Loaded schema for table: {schema.get('table_id', 'unknown')}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(f"Loaded schema for table: {schema.get('table_id', 'unknown')}")
             else:
                 logger.warning("No schema data available in cache")
                 
@@ -156,7 +257,8 @@ class MetaSyncRepository(GCSRepository):
             cache_data = self.get_cache_data()
             examples = cache_data.get('examples', [])
             
-            logger.info(f"Loaded {len(examples)} few-shot examples")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Loaded {len(examples)} few-shot examples")
             return examples
             
         except Exception as e:
@@ -170,7 +272,8 @@ class MetaSyncRepository(GCSRepository):
             table_id = schema.get('table_id', '')
             
             if table_id:
-                logger.info(f"Using table ID: {table_id}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(f"Using table ID: {table_id}")
             else:
                 logger.warning("No table ID found in cache")
                 
@@ -188,7 +291,8 @@ class MetaSyncRepository(GCSRepository):
             
             events_tables = events_info.get('example_tables', [])
             if events_tables:
-                logger.info(f"Using {len(events_tables)} example tables from abstracted info")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(f"Using {len(events_tables)} example tables from abstracted info")
             else:
                 logger.warning("No example tables found in cache")
             
@@ -246,7 +350,8 @@ class MetaSyncRepository(GCSRepository):
             cache_data = self.get_cache_data()
             method = cache_data.get('generation_method', 'unknown')
             
-            logger.info(f"Cache generation method: {method}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Cache generation method: {method}")
             return method
             
         except Exception as e:
@@ -255,51 +360,77 @@ class MetaSyncRepository(GCSRepository):
     
     def is_cache_available(self) -> bool:
         """캐시 사용 가능 여부 확인 - 기존 인터페이스 호환"""
+        # 짧은 시간 내 반복 확인(헬스체크 등)은 직전 결과 재사용
+        cached = self._availability_cache
+        if cached is not None and (time.monotonic() - cached[0]) < _AVAILABILITY_TTL:
+            return cached[1]
+        
         try:
-            blob = self.bucket.blob(self.cache_file_path)
-            if not blob.exists():
+            blob = self.bucket.get_blob(self.cache_file_path)
+            if blob is None:
                 logger.info("Cache file does not exist")
-                return False
-            
-            # 캐시 만료 확인 (24시간)
-            blob.reload()
-            age = datetime.now(blob.updated.tzinfo) - blob.updated
-            if age > timedelta(hours=24):
-                logger.warning(f"Cache is expired (age: {age})")
-                return False
-                
-            return True
+                available = False
+            else:
+                # 캐시 만료 확인 (24시간)
+                available = self._is_within_max_age(blob.updated)
+            
+            self._availability_cache = (time.monotonic(), available)
+            return available
             
         except Exception as e:
             logger.error(f"Failed to check cache availability: {e}")
             return False
     
+    @staticmethod
+    def _is_within_max_age(updated: datetime) -> bool:
+        """캐시 파일 갱신 시각이 만료 기준(24시간) 이내인지 확인"""
+        age = datetime.now(updated.tzinfo) - updated
+        if age > _CACHE_MAX_AGE:
+            logger.warning(f"Cache is expired (age: {age})")
+            return False
+        return True
+    
     def get_cache_metadata(self) -> Dict[str, Any]:
         """캐시 메타데이터 조회 - 기존 인터페이스 호환"""
         try:
-            cache_data = self.get_cache_data()
+            # 메모리 캐시가 아직 없으면 전체 캐시 대신 작은 메타데이터 파일만 조회
+            if self._state is None:
+                meta_bytes, _ = self.read_bytes(self.cache_meta_file_path)
+                if meta_bytes:
+                    return orjson.loads(meta_bytes)
             
-            return {
-                'generated_at': cache_data.get('generated_at'),
-                'generation_method': cache_data.get('generation_method', 'unknown'),
-                'schema_available': bool(cache_data.get('schema')),
-                'examples_count': len(cache_data.get('examples', [])),
-                'events_tables_count': len(cache_data.get('events_tables', {})),
-                'has_schema_insights': bool(cache_data.get('schema_insights')),
-                'table_id': cache_data.get('schema', {}).get('table_id'),
-                'columns_count': len(cache_data.get('schema', {}).get('columns', [])),
-                'llm_enhanced': cache_data.get('generation_method') == 'llm_enhanced'
-            }
+            # 메타데이터 파일이 없는 기존 캐시는 전체 캐시에서 계산 (같은 캐시 데이터에 대해서는 재사용)
+            cache_data = self.get_cache_data()
+            cached = self._metadata_view
+            if cached is None or cached[0] is not cache_data:
+                cached = (cache_data, self._build_cache_metadata(cache_data))
+                self._metadata_view = cached
+            return dict(cached[1])
             
         except Exception as e:
             logger.error(f"Failed to get cache metadata: {e}")
             return {}
     
+    @staticmethod
+    def _build_cache_metadata(cache_data: Dict[str, Any]) -> Dict[str, Any]:
+        """캐시 데이터에서 메타데이터 요약 생성"""
+        return {
+            'generated_at': cache_data.get('generated_at'),
+            'generation_method': cache_data.get('generation_method', 'unknown'),
+            'schema_available': bool(cache_data.get('schema')),
+            'examples_count': len(cache_data.get('examples', [])),
+            'events_tables_count': len(cache_data.get('events_tables', {})),
+            'has_schema_insights': bool(cache_data.get('schema_insights')),
+            'table_id': cache_data.get('schema', {}).get('table_id'),
+            'columns_count': len(cache_data.get('schema', {}).get('columns', [])),
+            'llm_enhanced': cache_data.get('generation_method') == 'llm_enhanced'
+        }
+    
     def refresh_cache(self) -> bool:
         """캐시 강제 새로고침 - 기존 인터페이스 호환"""
         try:
-            self._cache_data = None
-            self._last_loaded = None
+            with self._lock:
+                self._state = None
             
             # 새로 로드
             cache_data = self.get_cache_data()
@@ -327,18 +458,30 @@ class MetaSyncRepository(GCSRepository):
         """
         try:
             cache_data = metadata_cache.to_dict()
+            cache_bytes = dump_json_bytes(cache_data)
             
             # GCS에 저장
-            success = self.write_json(
+            generation = self.write_json_bytes(
                 self.cache_file_path, 
-                cache_data, 
+                cache_bytes, 
                 create_snapshot=create_snapshot
             )
             
-            if success:
-                # 메모리 캐시 업데이트
-                self._cache_data = cache_data
-                self._last_loaded = datetime.now()
+            if generation is not None:
+                # 메모리 캐시 업데이트 (저장한 바이트와 generation 그대로 재사용)
+                with self._lock:
+                    self._state = _CacheState(cache_data, cache_bytes, generation, datetime.now())
+                self._availability_cache = None
+                self._metadata_view = (cache_data, self._build_cache_metadata(cache_data))
+                if create_snapshot:
+                    self._snapshots_cache = None
+                
+                # 메타데이터 요약 파일 저장 (실패해도 전체 캐시에서 계산 가능하므로 무시)
+                self.write_json(
+                    self.cache_meta_file_path,
+                    self._metadata_view[1],
+                    create_snapshot=False
+                )
                 
                 logger.info("Metadata cache saved successfully")
                 return {
@@ -384,14 +527,19 @@ class MetaSyncRepository(GCSRepository):
             
             # 캐시 데이터 조회
             cache_data = self.get_cache_data()
+            events_tables = cache_data.get('events_tables') or {}
+            
+            # 만료 여부는 이미 조회한 메타데이터로 판단 (추가 GCS 요청 없음)
+            updated = blob_metadata.get('updated')
+            is_valid = bool(updated) and self._is_within_max_age(datetime.fromisoformat(updated))
             
             return CacheStatus(
                 exists=True,
-                last_updated=blob_metadata.get('updated'),
+                last_updated=updated,
                 size_bytes=blob_metadata.get('size'),
-                table_count=len(cache_data.get('schema', {})),
+                table_count=events_tables.get('count', len(events_tables.get('example_tables', []))),
                 example_count=len(cache_data.get('examples', [])),
-                is_valid=self.is_cache_available()
+                is_valid=is_valid
             )
             
         except Exception as e:
@@ -419,14 +567,16 @@ class MetaSyncRepository(GCSRepository):
         try:
             table = self.bigquery_client.get_table(table_id)
             
-            columns = []
-            for field in table.schema:
-                columns.append({
+            # 캐시/프롬프트 형식(컬럼별 레코드)은 유지하고 한 번의 컴프리헨션으로 생성
+            columns = [
+                {
                     "name": field.name,
                     "type": field.field_type,
                     "mode": field.mode,
                     "description": field.description or ""
-                })
+                }
+                for field in table.schema
+            ]
             
             schema_info = SchemaInfo(
                 table_id=table_id,
@@ -463,18 +613,27 @@ class MetaSyncRepository(GCSRepository):
             project_id = table_parts[0]
             dataset_id = table_parts[1]
             
-            # dataset의 모든 테이블 조회
-            dataset_ref = self.bigquery_client.dataset(dataset_id, project=project_id)
-            tables = list(self.bigquery_client.list_tables(dataset_ref))
-            
-            # events_ 패턴 필터링 및 정렬
-            events_tables = []
-            for table in tables:
-                if table.table_id.startswith('events_'):
-                    full_table_id = f"{project_id}.{dataset_id}.{table.table_id}"
-                    events_tables.append(full_table_id)
+            # events_ 패턴 필터링과 정렬을 서버에서 한 번에 처리 (list_tables 페이지 순회 대신 단일 쿼리)
+            # 쿼리 작업은 과금 대상이고 bigquery.jobs.create 권한이 필요하므로 실패 시 list_tables로 대체
+            try:
+                query = f"""
+                SELECT table_name
+                FROM `{project_id}.{dataset_id}.INFORMATION_SCHEMA.TABLES`
+                WHERE STARTS_WITH(table_name, 'events_')
+                ORDER BY table_name
+                """
+                job_config = bigquery.QueryJobConfig(maximum_bytes_billed=_TABLES_LIST_MAX_BYTES_BILLED)
+                rows = self.bigquery_client.query(query, job_config=job_config).result(page_size=10000)
+                table_names = [row.table_name for row in rows]
+            except Exception as e:
+                logger.warning(f"INFORMATION_SCHEMA query failed, falling back to list_tables: {str(e)}")
+                dataset_ref = bigquery.DatasetReference(project_id, dataset_id)
+                table_names = sorted(
+                    table.table_id for table in self.bigquery_client.list_tables(dataset_ref)
+                    if table.table_id.startswith('events_')
+                )
             
-            events_tables.sort()
+            events_tables = [f"{project_id}.{dataset_id}.{name}" for name in table_names]
             
             logger.info(f"Found {len(events_tables)} events tables in dataset {dataset_id}")
             return events_tables
@@ -495,19 +654,30 @@ class MetaSyncRepository(GCSRepository):
             샘플 데이터 목록
         """
         try:
-            query = f"""
-            SELECT *
-            FROM `{table_id}`
-            ORDER BY RAND()
-            LIMIT {limit}
-            """
-            
-            query_job = self.bigquery_client.query(query)
-            results = query_job.result()
+            job_config = bigquery.QueryJobConfig(
+                query_parameters=[bigquery.ScalarQueryParameter("limit", "INT64", limit)],
+                use_query_cache=True,
+                maximum_bytes_billed=_SAMPLE_MAX_BYTES_BILLED
+            )
             
-            sample_data = []
-            for row in results:
-                sample_data.append(dict(row))
+            # 전체 스캔+정렬(ORDER BY RAND()) 대신 일부 블록만 읽는 TABLESAMPLE 사용
+            try:
+                query = f"SELECT * FROM `{table_id}` TABLESAMPLE SYSTEM (1 PERCENT) LIMIT @limit"
+                sample_data = [dict(row) for row in self.bigquery_client.query(query, job_config=job_config).result()]
+            except Exception as e:
+                # 뷰 등 TABLESAMPLE을 지원하지 않는 대상
+                logger.warning(f"TABLESAMPLE not available for {table_id}: {str(e)}")
+                sample_data = []
+            
+            # 작은 테이블은 표본이 비어 있을 수 있으므로 앞쪽 행을 직접 읽어 보완
+            # (SELECT ... LIMIT은 전체 스캔으로 과금되므로 쿼리 비용이 없는 tabledata.list 사용)
+            if not sample_data:
+                try:
+                    sample_data = [dict(row) for row in self.bigquery_client.list_rows(table_id, max_results=limit)]
+                except Exception as e:
+                    # 뷰는 행 목록 조회를 지원하지 않으므로 전체 스캔 없이 샘플 생략
+                    logger.warning(f"Skipping sample data for {table_id}: {str(e)}")
+                    return []
             
             logger.info(f"Fetched {len(sample_data)} sample rows from {table_id}")
             return sample_data
@@ -516,6 +686,40 @@ class MetaSyncRepository(GCSRepository):
             logger.error(f"Failed to fetch sample data from {table_id}: {str(e)}")
             return []
     
+    def get_llm_cache(self, key: str) -> Optional[str]:
+        """
+        저장된 LLM 응답 조회 (MetaSync 예시/인사이트 생성용)
+        
+        Args:
+            key: 프롬프트 해시 키
+            
+        Returns:
+            LLM 응답 텍스트 또는 None
+        """
+        try:
+            content, _ = self.read_bytes(f"{self.llm_cache_prefix}{key}.json")
+            return content.decode('utf-8') if content else None
+        except Exception as e:
+            logger.error(f"Failed to read LLM cache {key}: {str(e)}")
+            return None
+    
+    def set_llm_cache(self, key: str, response: str) -> bool:
+        """
+        LLM 응답 저장
+        
+        Args:
+            key: 프롬프트 해시 키
+            response: LLM 응답 텍스트 (JSON)
+            
+        Returns:
+            성공 여부
+        """
+        return self.write_json_bytes(
+            f"{self.llm_cache_prefix}{key}.json",
+            response.encode('utf-8'),
+            create_snapshot=False
+        ) is not None
+    
     def list_cache_snapshots(self) -> List[str]:
         """
         캐시 스냅샷 목록 조회
@@ -524,19 +728,30 @@ class MetaSyncRepository(GCSRepository):
             스냅샷 파일 경로 목록
         """
         try:
-            snapshots = self.list_blobs(prefix="snapshots/")
-            snapshots.sort(reverse=True)  # 최신순 정렬
+            # 스냅샷은 save_cache에서만 생기므로 짧은 시간 동안 목록 재사용
+            cached = self._snapshots_cache
+            if cached is not None and (time.monotonic() - cached[0]) < _SNAPSHOT_LIST_TTL:
+                return list(cached[1])
+            
+            snapshots = self.list_blobs(prefix="snapshots/", max_results=_SNAPSHOT_LIST_MAX)
+            snapshots.sort(reverse=True)  # 최신순 정렬 (이름에 타임스탬프 포함)
+            self._snapshots_cache = (time.monotonic(), snapshots)
             
             logger.info(f"Found {len(snapshots)} cache snapshots")
-            return snapshots
+            return list(snapshots)
             
         except Exception as e:
             logger.error(f"Failed to list cache snapshots: {str(e)}")
             return []
 
 
+# 빈 캐시 구조의 JSON 바이트 (실패 경로마다 다시 직렬화하지 않도록 미리 생성)
+_EMPTY_CACHE_JSON = dump_json_bytes(MetaSyncRepository._get_empty_cache_structure())
+
+
 # 전역 인스턴스 (싱글톤 패턴) - 기존 호환성
 _metasync_repository = None
+_metasync_repository_lock = threading.Lock()
 
 def get_metasync_repository(bucket_name: str = "nlq-metadata-cache",
                           project_id: Optional[str] = None,
@@ -548,7 +763,10 @@ def get_metasync_repository(bucket_name: str = "nlq-metadata-cache",
     global _metasync_repository
     
     if _metasync_repository is None:
-        _metasync_repository = MetaSyncRepository(bucket_name, project_id, bigquery_location)
-        logger.info(f"Created MetaSyncRepository for bucket: {bucket_name}")
+        # 동시 첫 요청에서 인스턴스가 중복 생성되지 않도록 잠금 후 재확인
+        with _metasync_repository_lock:
+            if _metasync_repository is None:
+                _metasync_repository = MetaSyncRepository(bucket_name, project_id, bigquery_location)
+                logger.info(f"Created MetaSyncRepository for bucket: {bucket_name}")
     
     return _metasync_repository
\ No newline at end of file
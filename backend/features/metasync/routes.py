@@ -3,7 +3,7 @@ MetaSync Routes - API 엔드포인트
 메타데이터 캐시 관리를 위한 REST API
 """
 
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, Response, request, jsonify, current_app
 from typing import Dict, Any
 
 from features.metasync.services import MetaSyncService
@@ -32,12 +32,25 @@ def get_cache():
         if not metasync_service:
             return jsonify(ErrorResponse.internal_error("MetaSync service not available")), 500
         
-        # 캐시 데이터 조회 (원본 JSON 문자열 그대로 반환 - 순서 보장)
-        cache_raw = metasync_service.repository.get_cache_data_raw()
+        repository = metasync_service.repository
         
-        # JSON 문자열을 그대로 반환 (원본 순서 보장)
-        from flask import Response
-        return Response(cache_raw, content_type='application/json')
+        # GCS generation 기반 ETag - 클라이언트가 최신본을 갖고 있으면 본문 없이 304
+        etag = repository.get_cache_etag()
+        if etag and request.if_none_match.contains(etag):
+            response = Response(status=304)
+        elif 'gzip' in request.accept_encodings:
+            # 미리 압축해 둔 gzip 바이트 반환
+            response = Response(repository.get_cache_data_gzip(), content_type='application/json')
+            response.headers['Content-Encoding'] = 'gzip'
+        else:
+            # 캐시 데이터 조회 (메모리에 캐시된 원본 JSON 바이트 - 순서 보장)
+            response = Response(repository.get_cache_data_raw(), content_type='application/json')
+        
+        if etag:
+            response.set_etag(etag)
+        response.headers['Cache-Control'] = 'private, max-age=0, must-revalidate'
+        response.headers['Vary'] = 'Accept-Encoding'
+        return response
         
     except Exception as e:
         logger.error(f"Failed to get cache: {str(e)}")
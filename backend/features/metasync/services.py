@@ -4,8 +4,12 @@ Cloud Function MetaSync의 핵심 로직을 백엔드 Feature로 이전
 LLMService 재사용으로 중복 코드 제거
 """
 
-import json
-from typing import Optional, Dict, Any, List
+import threading
+import orjson
+import xxhash
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, timezone
 
 from features.metasync.models import (
@@ -13,11 +17,16 @@ from features.metasync.models import (
     CacheUpdateRequest, CacheStatus
 )
 from features.metasync.repositories import MetaSyncRepository
+from features.metasync.utils import scan_events_tables
 from features.llm.services import LLMService
+from features.llm.utils import extract_json_from_response
 from utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+# LLM 프롬프트에 사용하는 샘플 데이터 행 수 (BigQuery 조회 크기와 동일)
+_PROMPT_SAMPLE_ROWS = 5
+
 
 class MetaSyncService:
     """
@@ -39,6 +48,9 @@ class MetaSyncService:
         self.llm_service = llm_service
         self.repository = repository or MetaSyncRepository()
         self.default_table = default_table
+        # 캐시 상태 조회 결과 캐시 (헬스체크 등 반복 조회 시 GCS 메타데이터 요청 생략)
+        self._status_cache: TTLCache = TTLCache(maxsize=1, ttl=30)
+        self._status_cache_lock = threading.Lock()
     
     def get_cache_data(self) -> Dict[str, Any]:
         """
@@ -62,7 +74,15 @@ class MetaSyncService:
             CacheStatus 객체
         """
         try:
-            return self.repository.get_cache_status()
+            with self._status_cache_lock:
+                cached = self._status_cache.get('status')
+            if cached is not None:
+                return cached
+            
+            status = self.repository.get_cache_status()
+            with self._status_cache_lock:
+                self._status_cache['status'] = status
+            return status
         except Exception as e:
             logger.error(f"Failed to get cache status: {str(e)}")
             return CacheStatus(
@@ -75,6 +95,11 @@ class MetaSyncService:
                 error_message=str(e)
             )
     
+    def _invalidate_status_cache(self) -> None:
+        """캐시 저장/새로고침 후 상태 조회 결과 캐시 무효화"""
+        with self._status_cache_lock:
+            self._status_cache.clear()
+    
     def update_cache(self, request: Optional[CacheUpdateRequest] = None) -> Dict[str, Any]:
         """
         메타데이터 캐시 업데이트 (Cloud Function 메인 로직)
@@ -100,29 +125,39 @@ class MetaSyncService:
                     "status": self.get_cache_status().to_dict()
                 }
             
-            # 2. BigQuery 스키마 조회
-            logger.info(f"Fetching schema for {self.default_table}")
-            schema_info = self.repository.fetch_bigquery_schema(self.default_table)
-            
-            # 3. Events 테이블 목록 수집
-            logger.info("Fetching events tables list")
-            events_tables = self.repository.fetch_events_tables_list(self.default_table)
-            
-            # 4. 샘플 데이터 조회 (Few-Shot 예시 생성용)
-            sample_data = []
-            if request.include_examples:
-                logger.info("Fetching sample data for examples")
-                sample_data = self.repository.fetch_sample_data(self.default_table, limit=100)
+            # 2~4. BigQuery 스키마, Events 테이블 목록, 샘플 데이터 조회
+            # 서로 독립적인 I/O 호출이므로 동시에 실행 (bigquery.Client는 스레드 안전)
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                logger.info(f"Fetching schema for {self.default_table}")
+                schema_future = executor.submit(self.repository.fetch_bigquery_schema, self.default_table)
+                
+                logger.info("Fetching events tables list")
+                tables_future = executor.submit(self.repository.fetch_events_tables_list, self.default_table)
+                
+                # 샘플 데이터는 LLM 프롬프트용 - 실제로 사용하는 행 수만 조회
+                sample_future = None
+                if request.include_examples or request.include_insights:
+                    logger.info("Fetching sample data for LLM prompts")
+                    sample_future = executor.submit(
+                        self.repository.fetch_sample_data, self.default_table, _PROMPT_SAMPLE_ROWS
+                    )
+                
+                schema_info = schema_future.result()
+                events_tables = tables_future.result()
+                sample_data = sample_future.result() if sample_future else []
             
-            # 5. Few-Shot 예시 생성 (LLM 활용)
+            # 5~6. Few-Shot 예시 및 스키마 인사이트 생성 (LLM 활용, 둘 다 필요하면 한 번의 호출로 생성)
             examples = []
-            if request.include_examples:
+            schema_insights = {}
+            if request.include_examples and request.include_insights:
+                logger.info("Generating Few-Shot examples and schema insights using LLM")
+                examples, schema_insights = self._generate_examples_and_insights(
+                    schema_info, events_tables, sample_data
+                )
+            elif request.include_examples:
                 logger.info("Generating Few-Shot examples using LLM")
                 examples = self._generate_few_shot_examples(schema_info, events_tables, sample_data)
-            
-            # 6. 스키마 인사이트 생성 (LLM 활용)
-            schema_insights = {}
-            if request.include_insights:
+            elif request.include_insights:
                 logger.info("Generating schema insights using LLM")
                 schema_insights = self._generate_schema_insights(schema_info, sample_data)
             
@@ -142,6 +177,7 @@ class MetaSyncService:
             # 9. 캐시 저장
             logger.info("Saving metadata cache")
             save_result = self.repository.save_cache(metadata_cache, create_snapshot=True)
+            self._invalidate_status_cache()
             
             if save_result.get("success"):
                 logger.info("Metadata cache updated successfully")
@@ -201,16 +237,14 @@ JSON 형식:
 [{"description": "질문", "sql_query": "SELECT ..."}]"""
 
             # 스키마 정보 포맷팅
-            schema_text = "테이블 스키마:\n"
-            for col in schema_info.columns:
-                schema_text += f"- {col['name']} ({col['type']}): {col.get('description', '')}\n"
+            schema_text = self._format_schema_text(schema_info)
 
             user_prompt = f"""{schema_text}
 
 3개 예시 생성: 전체 조회, 날짜별 집계, 이벤트 타입별 분석"""
 
-            # LLM 호출 (LLMService의 직접 호출 메서드 활용)
-            response = self.llm_service.call_llm_direct(
+            # LLM 호출 (스키마가 같으면 GCS에 저장된 이전 응답 재사용)
+            response = self._call_llm_cached(
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
                 max_tokens=1000,
@@ -220,22 +254,15 @@ JSON 형식:
             if response:
                 try:
                     # JSON 응답 파싱
-                    examples_data = json.loads(response)
+                    examples_data = orjson.loads(response)
                     if isinstance(examples_data, list) and len(examples_data) > 0:
-                        examples = []
-                        for example_data in examples_data:
-                            example = FewShotExample(
-                                description=example_data.get('description', ''),
-                                sql_query=example_data.get('sql_query', ''),
-                                result_summary=example_data.get('result_summary')
-                            )
-                            examples.append(example)
+                        examples = self._parse_examples(examples_data)
                         
                         logger.info(f"Generated {len(examples)} examples using LLM")
                         return examples
                     else:
                         logger.warning("LLM response is not a valid list")
-                except json.JSONDecodeError as e:
+                except orjson.JSONDecodeError as e:
                     logger.warning(f"Failed to parse LLM response as JSON: {e}")
             
             # LLM 실패 시 폴백 예시
@@ -246,6 +273,159 @@ JSON 형식:
             logger.error(f"Error in _generate_few_shot_examples: {e}")
             return self._generate_fallback_examples(example_table, events_tables)
     
+    def _generate_examples_and_insights(self, schema_info: SchemaInfo,
+                                        events_tables: List[str],
+                                        sample_data: List[Dict[str, Any]]) -> Tuple[List[FewShotExample], Dict[str, Any]]:
+        """
+        Few-Shot 예시와 스키마 인사이트를 한 번의 LLM 호출로 생성
+        스키마/샘플 텍스트를 한 번만 전송하고, 섹션별로 파싱 실패 시 각각 폴백
+        
+        Args:
+            schema_info: 테이블 스키마 정보
+            events_tables: Events 테이블 목록
+            sample_data: 샘플 데이터
+            
+        Returns:
+            (생성된 Few-Shot 예시 목록, 스키마 인사이트)
+        """
+        example_table = events_tables[-1] if events_tables else self.default_table
+        examples: List[FewShotExample] = []
+        insights: Dict[str, Any] = {}
+        
+        try:
+            system_prompt = """BigQuery 테이블의 스키마를 보고 두 섹션을 하나의 JSON 객체로 생성하세요.
+
+섹션 [EXAMPLES] - 3개의 간단한 SQL 예시:
+- event_timestamp는 TIMESTAMP_MICROS()로 변환
+- 모든 쿼리에 LIMIT 100 포함
+- 기본 조회, 집계, 시간 분석 위주
+
+섹션 [INSIGHTS] - 간단한 분석 정보
+
+JSON 형식:
+{
+  "examples": [{"description": "질문", "sql_query": "SELECT ..."}],
+  "insights": {
+    "purpose": "이벤트 로그 테이블",
+    "key_columns": ["event_name", "user_id", "event_timestamp"],
+    "analysis_tips": ["시간대별 분석 가능", "사용자별 행동 추적"]
+  }
+}"""
+
+            user_prompt = f"""{self._format_schema_text(schema_info)}{self._format_sample_text(sample_data)}
+
+[EXAMPLES] 3개 예시 생성: 전체 조회, 날짜별 집계, 이벤트 타입별 분석
+[INSIGHTS] 간단한 분석 정보 생성"""
+
+            # LLM 호출 (기존 두 호출의 max_tokens 합)
+            response = self._call_llm_cached(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                max_tokens=1500,
+                temperature=0.3
+            )
+            
+            if response:
+                try:
+                    data = orjson.loads(response)
+                    if isinstance(data, dict):
+                        examples_data = data.get('examples')
+                        if isinstance(examples_data, list):
+                            examples = self._parse_examples(examples_data)
+                        if isinstance(data.get('insights'), dict):
+                            insights = data['insights']
+                    else:
+                        logger.warning("LLM response is not a valid dict")
+                except orjson.JSONDecodeError as e:
+                    logger.warning(f"Failed to parse combined LLM response as JSON: {e}")
+                    
+        except Exception as e:
+            logger.error(f"Error in _generate_examples_and_insights: {e}")
+        
+        if examples:
+            logger.info(f"Generated {len(examples)} examples using LLM")
+        else:
+            # 예시 섹션 실패 시 폴백 예시
+            logger.info("Falling back to hardcoded examples")
+            examples = self._generate_fallback_examples(example_table, events_tables)
+        
+        if insights:
+            logger.info("Generated schema insights using LLM")
+        else:
+            logger.info("No schema insights generated")
+        
+        return examples, insights
+    
+    def _call_llm_cached(self, system_prompt: str, user_prompt: str,
+                         max_tokens: int, temperature: float) -> Optional[str]:
+        """
+        LLMService.call_llm_direct 호출 결과를 GCS에 캐시
+        프롬프트(스키마 포함)와 모델이 같으면 이전 응답을 재사용
+        응답에서 JSON을 추출(코드 블록 등 제거)할 수 있으면 추출한 JSON만 저장/반환
+        
+        Returns:
+            LLM 응답 텍스트 또는 None
+        """
+        model_id = self.llm_service.get_direct_model_id()
+        key = xxhash.xxh3_64_hexdigest(orjson.dumps(
+            [model_id, system_prompt, user_prompt, max_tokens, temperature]
+        ))
+        
+        cached = self.repository.get_llm_cache(key)
+        if cached is not None:
+            logger.info(f"Reusing cached LLM response: {key}")
+            return cached
+        
+        response = self.llm_service.call_llm_direct(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            max_tokens=max_tokens,
+            temperature=temperature
+        )
+        
+        if response:
+            parsed = extract_json_from_response(response)
+            if parsed is not None:
+                response = orjson.dumps(parsed).decode()
+                self.repository.set_llm_cache(key, response)
+        return response
+    
+    @staticmethod
+    def _parse_examples(examples_data: List[Any]) -> List[FewShotExample]:
+        """LLM 응답의 예시 목록을 FewShotExample 목록으로 변환 (딕셔너리가 아닌 항목은 제외)"""
+        return [
+            FewShotExample(
+                description=example_data.get('description', ''),
+                sql_query=example_data.get('sql_query', ''),
+                result_summary=example_data.get('result_summary')
+            )
+            for example_data in examples_data
+            if isinstance(example_data, dict)
+        ]
+    
+    @staticmethod
+    def _format_schema_text(schema_info: SchemaInfo) -> str:
+        """LLM 프롬프트용 스키마 텍스트 포맷팅"""
+        schema_lines = ["테이블 스키마:"]
+        schema_lines.extend(
+            f"- {col['name']} ({col['type']}): {col.get('description', '')}" for col in schema_info.columns
+        )
+        schema_lines.append("")
+        return "\n".join(schema_lines)
+    
+    @staticmethod
+    def _format_sample_text(sample_data: List[Dict[str, Any]]) -> str:
+        """LLM 프롬프트용 샘플 데이터 텍스트 포맷팅 (샘플이 없으면 빈 문자열)"""
+        if not sample_data:
+            return ""
+        sample_lines = [f"샘플 데이터 (처음 {_PROMPT_SAMPLE_ROWS}개 행):"]
+        sample_lines.extend(
+            f"행 {i+1}: {orjson.dumps(row, default=str).decode()}"
+            for i, row in enumerate(sample_data[:_PROMPT_SAMPLE_ROWS])
+        )
+        sample_lines.append("")
+        return "\n".join(sample_lines)
+    
     def _generate_fallback_examples(self, example_table: str, 
                                   events_tables: List[str]) -> List[FewShotExample]:
         """
@@ -288,16 +468,9 @@ JSON 형식:
         Cloud Function의 generate_schema_insights_with_llm() 로직 이전
         """
         try:
-            # 스키마 정보 포맷팅
-            schema_text = "테이블 스키마:\n"
-            for col in schema_info.columns:
-                schema_text += f"- {col['name']} ({col['type']}): {col.get('description', '')}\n"
-            
-            # 샘플 데이터 포맷팅 (처음 5개)
-            sample_text = "샘플 데이터 (처음 5개 행):\n"
-            if sample_data:
-                for i, row in enumerate(sample_data[:5]):
-                    sample_text += f"행 {i+1}: {json.dumps(row, ensure_ascii=False, default=str)}\n"
+            # 스키마 / 샘플 데이터 포맷팅
+            schema_text = self._format_schema_text(schema_info)
+            sample_text = self._format_sample_text(sample_data)
             
             system_prompt = """테이블 스키마를 보고 간단한 분석 정보를 JSON으로 생성하세요.
 
@@ -308,12 +481,12 @@ JSON 형식:
   "analysis_tips": ["시간대별 분석 가능", "사용자별 행동 추적"]
 }"""
 
-            user_prompt = f"""{schema_text}
+            user_prompt = f"""{schema_text}{sample_text}
 
 간단한 분석 정보 생성"""
 
-            # LLM 호출 (LLMService의 직접 호출 메서드 활용)
-            response = self.llm_service.call_llm_direct(
+            # LLM 호출 (스키마가 같으면 GCS에 저장된 이전 응답 재사용)
+            response = self._call_llm_cached(
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
                 max_tokens=500,
@@ -323,13 +496,13 @@ JSON 형식:
             if response:
                 try:
                     # JSON 응답 파싱
-                    insights = json.loads(response)
+                    insights = orjson.loads(response)
                     if isinstance(insights, dict):
                         logger.info("Generated schema insights using LLM")
                         return insights
                     else:
                         logger.warning("LLM response is not a valid dict")
-                except json.JSONDecodeError as e:
+                except orjson.JSONDecodeError as e:
                     logger.warning(f"Failed to parse LLM insights response as JSON: {e}")
             
             # LLM 실패 시 빈 인사이트 반환
@@ -349,16 +522,11 @@ JSON 형식:
             return None
         
         try:
-            # 날짜 범위 추출
-            dates = []
-            for table in events_tables:
-                # nlq-ex.test_dataset.events_20201101 -> 20201101
-                if 'events_' in table:
-                    date_part = table.split('events_')[-1]
-                    if len(date_part) == 8 and date_part.isdigit():
-                        dates.append(date_part)
+            # 날짜 범위 추출 (한 번의 순회로 최소/최대 날짜 계산)
+            # nlq-ex.test_dataset.events_20201101 -> 20201101
+            scan = scan_events_tables(events_tables)
             
-            if not dates:
+            if scan.min_date is None:
                 return EventsTableInfo(
                     count=len(events_tables),
                     pattern="events_YYYYMMDD",
@@ -366,21 +534,10 @@ JSON 형식:
                     example_tables=events_tables[:2] if len(events_tables) >= 2 else events_tables
                 )
             
-            dates.sort()
-            start_date = dates[0]  # 20201101
-            end_date = dates[-1]   # 20210131
-            
-            # 포맷팅된 날짜로 변환
-            def format_date(date_str: str) -> str:
-                return f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
-            
             events_info = EventsTableInfo(
                 count=len(events_tables),
                 pattern="nlq-ex.test_dataset.events_YYYYMMDD",
-                date_range={
-                    "start": format_date(start_date),
-                    "end": format_date(end_date)
-                },
+                date_range=scan.date_range(),
                 example_tables=[
                     events_tables[0],   # 첫 번째
                     events_tables[-1]   # 마지막
@@ -408,6 +565,7 @@ JSON 형식:
         """
         try:
             success = self.repository.refresh_cache()
+            self._invalidate_status_cache()
             
             if success:
                 return {
@@ -3,13 +3,18 @@ MetaSync 유틸리티 함수
 메타데이터 처리 및 변환을 위한 헬퍼 함수들
 """
 
+from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
 import re
+import orjson
 from datetime import datetime
 from utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+# events 테이블 이름 끝의 날짜 접미사 (events_YYYYMMDD)
+_EVENTS_DATE_RE = re.compile(r'events_(\d{8})$')
+
 
 def extract_date_from_table_name(table_name: str) -> Optional[str]:
     """
@@ -21,15 +26,9 @@ def extract_date_from_table_name(table_name: str) -> Optional[str]:
     Returns:
         추출된 날짜 (YYYYMMDD 형식) 또는 None
     """
-    try:
-        # events_YYYYMMDD 패턴에서 날짜 추출
-        match = re.search(r'events_(\d{8})', table_name)
-        if match:
-            return match.group(1)
-        return None
-    except Exception as e:
-        logger.warning(f"Failed to extract date from table name {table_name}: {e}")
-        return None
+    # events_YYYYMMDD 패턴에서 날짜 추출
+    match = _EVENTS_DATE_RE.search(table_name)
+    return match.group(1) if match else None
 
 
 def format_date_string(date_str: str) -> str:
@@ -89,6 +88,51 @@ def parse_table_id_components(table_id: str) -> Dict[str, str]:
         }
 
 
+@dataclass(slots=True)
+class EventsScan:
+    """events 테이블 목록 단일 순회 결과"""
+    tables: List[str]
+    min_date: Optional[str] = None
+    max_date: Optional[str] = None
+    
+    def date_range(self) -> Dict[str, str]:
+        """{"start": "YYYY-MM-DD", "end": "YYYY-MM-DD"} 형식 날짜 범위 (날짜가 없으면 빈 딕셔너리)"""
+        if self.min_date is None:
+            return {}
+        return {
+            "start": format_date_string(self.min_date),
+            "end": format_date_string(self.max_date)
+        }
+
+
+def scan_events_tables(table_names: List[str]) -> EventsScan:
+    """
+    테이블 목록을 한 번만 순회하며 events_YYYYMMDD 테이블과 날짜 범위를 함께 추출
+    
+    Args:
+        table_names: 테이블 이름 목록
+        
+    Returns:
+        EventsScan (입력 순서의 events 테이블 목록, 최소/최대 날짜)
+    """
+    tables = []
+    min_date = max_date = None
+    
+    for table_name in table_names:
+        match = _EVENTS_DATE_RE.search(table_name)
+        if not match:
+            continue
+        
+        date_str = match.group(1)
+        tables.append(table_name)
+        if min_date is None or date_str < min_date:
+            min_date = date_str
+        if max_date is None or date_str > max_date:
+            max_date = date_str
+    
+    return EventsScan(tables=tables, min_date=min_date, max_date=max_date)
+
+
 def filter_events_tables(table_names: List[str]) -> List[str]:
     """
     테이블 목록에서 events 패턴 테이블만 필터링
@@ -100,18 +144,8 @@ def filter_events_tables(table_names: List[str]) -> List[str]:
         events 패턴 테이블 목록 (정렬됨)
     """
     try:
-        events_tables = []
-        
-        for table_name in table_names:
-            # events_ 패턴 확인
-            if 'events_' in table_name:
-                # 날짜 패턴 확인 (YYYYMMDD)
-                date_part = extract_date_from_table_name(table_name)
-                if date_part:
-                    events_tables.append(table_name)
-        
-        # 날짜순 정렬
-        events_tables.sort()
+        # events_YYYYMMDD 패턴 테이블만 추출 후 날짜순 정렬
+        events_tables = sorted(scan_events_tables(table_names).tables)
         
         logger.info(f"Filtered {len(events_tables)} events tables from {len(table_names)} total tables")
         return events_tables
@@ -135,23 +169,8 @@ def get_date_range_from_tables(events_tables: List[str]) -> Dict[str, str]:
         if not events_tables:
             return {}
         
-        dates = []
-        for table in events_tables:
-            date_str = extract_date_from_table_name(table)
-            if date_str:
-                dates.append(date_str)
-        
-        if not dates:
-            return {}
-        
-        dates.sort()
-        start_date = format_date_string(dates[0])
-        end_date = format_date_string(dates[-1])
-        
-        return {
-            "start": start_date,
-            "end": end_date
-        }
+        # 정렬 없이 최소/최대 날짜만 추적
+        return scan_events_tables(events_tables).date_range()
         
     except Exception as e:
         logger.error(f"Failed to get date range from tables: {e}")
@@ -310,7 +329,7 @@ def calculate_cache_stats(cache_data: Dict[str, Any]) -> Dict[str, Any]:
             'events_tables_count': events_tables.get('count', 0),
             'events_tables_pattern': events_tables.get('pattern'),
             'has_schema_insights': bool(schema_insights),
-            'cache_size_estimate': len(str(cache_data))  # 대략적인 크기
+            'cache_size_estimate': len(orjson.dumps(cache_data, default=str))  # 직렬화 바이트 크기
         }
         
         # 날짜 범위 정보 추가
@@ -340,7 +359,8 @@ def is_cache_expired(generated_at: str, max_age_hours: int = 24) -> bool:
         만료 여부
     """
     try:
-        generated_time = datetime.fromisoformat(generated_at.replace('Z', '+00:00'))
+        # Python 3.11+의 fromisoformat(C 구현)은 'Z' 접미사도 직접 처리
+        generated_time = datetime.fromisoformat(generated_at)
         current_time = datetime.now(generated_time.tzinfo)
         age_hours = (current_time - generated_time).total_seconds() / 3600
         
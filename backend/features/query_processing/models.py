@@ -10,7 +10,7 @@ import uuid
     
 
 
-@dataclass
+@dataclass(slots=True)
 class QueryRequest:
     """쿼리 요청 - ContextBlock 기반"""
     user_id: str
@@ -22,7 +22,7 @@ class QueryRequest:
         if not self.context_block:
             # 새로운 ContextBlock 생성
             self.context_block = ContextBlock(
-                block_id=str(uuid.uuid4()),
+                block_id=uuid.uuid4().hex,
                 user_id=self.user_id,
                 timestamp=datetime.now(timezone.utc),
                 block_type=BlockType.QUERY,
@@ -32,7 +32,7 @@ class QueryRequest:
             )
 
 
-@dataclass  
+@dataclass(slots=True)
 class QueryResult:
     """쿼리 결과 - ContextBlock 포함"""
     success: bool
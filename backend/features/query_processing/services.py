@@ -7,11 +7,21 @@ from .models import QueryRequest, QueryResult
 from core.models import ContextBlock, BlockType, context_blocks_to_llm_format
 from utils.logging_utils import get_logger
 from features.llm.models import SQLGenerationRequest
+from google.api_core import exceptions as google_exceptions
 from google.cloud import bigquery
 import os
+import pybreaker
 
 logger = get_logger(__name__)
 
+# 연속 5회 실패 시 30초간 BigQuery 호출을 즉시 거부 (잘못된 SQL 등 4xx 오류는 장애로 보지 않음)
+_bigquery_breaker = pybreaker.CircuitBreaker(
+    fail_max=5,
+    reset_timeout=30,
+    exclude=[google_exceptions.ClientError],
+    name="bigquery"
+)
+
 
 class QueryProcessingService:
     """쿼리 처리 서비스 - ContextBlock 기반 (단순화)"""
@@ -107,6 +117,10 @@ class QueryProcessingService:
                 error=str(e)
             )
     
+    def _run_query(self, sql_query: str):
+        """BigQuery 쿼리 실행 후 결과 대기"""
+        return self.bigquery_client.query(sql_query).result()
+    
     def _execute_bigquery(self, sql_query: str) -> Dict[str, Any]:
         """
         BigQuery 쿼리 직접 실행
@@ -123,9 +137,8 @@ class QueryProcessingService:
             
             logger.info(f"BigQuery 쿼리 실행 중: {sql_query[:100]}...")
             
-            # 쿼리 실행
-            query_job = self.bigquery_client.query(sql_query)
-            results = query_job.result()
+            # 쿼리 실행 (장애 시 서킷 브레이커가 즉시 실패 처리)
+            results = _bigquery_breaker.call(self._run_query, sql_query)
             
             # 결과 데이터 변환
             data = []
@@ -0,0 +1,82 @@
+"""
+유사 입력 분류 캐시 테스트 - 표현이 비슷해도 의도가 다른 입력은 합쳐지지 않아야 함
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+services = pytest.importorskip("features.input_classification.services")
+
+from features.llm.models import ClassificationResponse
+
+
+class _FakeModel:
+    """고정 벡터를 돌려주는 임베딩 모델 (유사도 0.96짜리 문장 쌍 구성)"""
+
+    _BASE = np.array([1.0, 0.0], dtype=np.float32)
+    _NEAR = np.array([0.96, 0.28], dtype=np.float32)
+
+    def __init__(self, near_messages):
+        self.near_messages = set(near_messages)
+
+    def encode(self, message, normalize_embeddings=True):
+        return self._NEAR if message in self.near_messages else self._BASE
+
+
+class _FakeLLMService:
+    """입력별로 정해진 분류 결과를 돌려주는 LLM 서비스"""
+
+    def __init__(self, categories, confidence=0.95):
+        self.categories = categories
+        self.confidence = confidence
+        self.calls = []
+
+    def classify_input(self, request):
+        self.calls.append(request.user_input)
+        return ClassificationResponse(
+            category=self.categories[request.user_input],
+            confidence=self.confidence,
+            reasoning="test"
+        )
+
+    def is_degraded(self):
+        return False
+
+
+def _service(llm_service, near_messages):
+    service = services.InputClassificationService(llm_service, similarity_cache=True)
+    cache = service._sim_cache
+    cache._model = _FakeModel(near_messages)
+    cache._vecs = np.zeros((cache.capacity, 2), dtype=np.float32)
+    cache._ctx = np.zeros(cache.capacity, dtype=np.int64)
+    return service
+
+
+def test_near_paraphrase_with_different_intent_is_not_merged():
+    llm = _FakeLLMService({
+        "테이블 목록 보여줘": "metadata_request",
+        "테이블 개수 보여줘": "query_request",
+    })
+    service = _service(llm, near_messages={"테이블 개수 보여줘"})
+
+    assert service.classify("테이블 목록 보여줘") == "metadata_request"
+    assert service.classify("테이블 개수 보여줘") == "query_request"
+    assert llm.calls == ["테이블 목록 보여줘", "테이블 개수 보여줘"]
+
+
+def test_same_words_with_particle_difference_is_reused():
+    llm = _FakeLLMService({"매출 보여줘": "query_request"})
+    service = _service(llm, near_messages={"매출을 보여줘"})
+
+    assert service.classify("매출 보여줘") == "query_request"
+    assert service.classify("매출을 보여줘") == "query_request"
+    assert llm.calls == ["매출 보여줘"]
+
+
+def test_low_confidence_result_is_not_reused():
+    llm = _FakeLLMService({"매출 보여줘": "query_request", "매출을 보여줘": "data_analysis"}, confidence=0.7)
+    service = _service(llm, near_messages={"매출을 보여줘"})
+
+    assert service.classify("매출 보여줘") == "query_request"
+    assert service.classify("매출을 보여줘") == "data_analysis"
+    assert llm.calls == ["매출 보여줘", "매출을 보여줘"]
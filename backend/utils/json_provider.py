@@ -0,0 +1,56 @@
+"""
+orjson 기반 Flask JSON Provider
+jsonify() 등 모든 JSON 응답 직렬화를 orjson으로 처리
+"""
+
+from typing import Any
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+# orjson 출력과 같은 구분자 (들여쓰기 없음 / 2칸 들여쓰기)
+_COMPACT_SEPARATORS = (",", ":")
+_INDENT_SEPARATORS = (",", ": ")
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    DefaultJSONProvider와 같은 출력 규칙(키 정렬, 날짜 형식, 디버그 들여쓰기)을 유지하면서
+    직렬화만 orjson으로 대체
+
+    orjson으로 표현할 수 없는 옵션(ensure_ascii=True, 2칸 외 들여쓰기, 기타 json.dumps 인자)이
+    주어지면 기본 Provider(표준 json)로 처리
+    """
+
+    # orjson은 항상 UTF-8로 출력 (ensure_ascii=True를 명시한 호출만 표준 json 사용)
+    ensure_ascii = False
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """객체를 JSON 문자열로 직렬화"""
+        default = kwargs.pop('default', self.default)
+        sort_keys = kwargs.pop('sort_keys', self.sort_keys)
+        ensure_ascii = kwargs.pop('ensure_ascii', self.ensure_ascii)
+        indent = kwargs.pop('indent', None)
+        separators = kwargs.pop('separators', None)
+
+        expected_separators = _INDENT_SEPARATORS if indent else _COMPACT_SEPARATORS
+        if kwargs or ensure_ascii or indent not in (None, 2) or separators not in (None, expected_separators):
+            return super().dumps(
+                obj, default=default, sort_keys=sort_keys, ensure_ascii=ensure_ascii,
+                indent=indent, separators=separators, **kwargs
+            )
+
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+
+        # 날짜(HTTP date), Decimal, UUID 등은 기존 Flask 기본 변환 사용
+        return orjson.dumps(obj, default=default, option=option).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """JSON 문자열/바이트를 파싱"""
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
@@ -120,6 +120,10 @@ class StandardLogger:
     def raw_log(self, level: int, message: str, **kwargs):
         """이모지 없는 원본 로그"""
         self.logger.log(level, message, **kwargs)
+    
+    def isEnabledFor(self, level: int) -> bool:
+        """해당 레벨 로그 출력 여부 (메시지 생성 비용이 큰 경우 사전 확인용)"""
+        return self.logger.isEnabledFor(level)
 
 def get_logger(name: str) -> StandardLogger:
     """
@@ -5,7 +5,7 @@
 import { useChatStore } from '../stores/useChatStore';
 import { useSession } from './useSession';
 import api, { createSSERequest } from '../lib/api';
-import type { SSEProgressEvent, SSEResultEvent, SSEErrorEvent, ChatRequest } from '../lib/types/api';
+import type { SSEProgressEvent, SSEMessageChunkEvent, SSEDegradedEvent, SSEResultEvent, SSEErrorEvent, ChatRequest } from '../lib/types/api';
 
 export const useChat = () => {
   const { 
@@ -51,6 +51,8 @@ export const useChat = () => {
       const reader = response.body.getReader();
       const decoder = new TextDecoder();
       let buffer = '';
+      // 토큰 스트리밍(데이터 분석)으로 지금까지 받은 응답 텍스트
+      let streamedContent = '';
 
       while (true) {
         const { done, value } = await reader.read();
@@ -84,7 +86,22 @@ export const useChat = () => {
             const parsedData = JSON.parse(data);
 
             // 이벤트 타입별 처리
-            if (eventType === 'progress' || parsedData.stage) {
+            if (eventType === 'message_chunk') {
+              // 생성되는 응답 조각을 마지막 메시지에 이어 붙여 바로 표시
+              const chunkEvent = parsedData as SSEMessageChunkEvent;
+              streamedContent += chunkEvent.delta;
+              updateLastMessage({
+                content: streamedContent,
+                isProgress: false
+              });
+            } else if (eventType === 'degraded') {
+              // AI 서비스 장애(서킷 브레이커 열림) 안내를 응답 대신 표시
+              const degradedEvent = parsedData as SSEDegradedEvent;
+              updateLastMessage({
+                content: `⚠️ ${degradedEvent.message}`,
+                isProgress: false
+              });
+            } else if (eventType === 'progress' || parsedData.stage) {
               const progressEvent = parsedData as SSEProgressEvent;
               
               // '완료!' 메시지는 UI 업데이트에서 제외
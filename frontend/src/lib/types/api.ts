@@ -27,6 +27,14 @@ export interface SSEResultEvent {
   };
 }
 
+export interface SSEMessageChunkEvent {
+  delta: string;
+}
+
+export interface SSEDegradedEvent {
+  message: string;
+}
+
 export interface SSEErrorEvent {
   error: string;
   error_type: string;